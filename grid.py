@@ -97,7 +97,7 @@ class Grid:
             return False
 
         # Handle ONE_VCORE kernels
-        if kernel_size.size == KernelSize.ONE_VCORE:
+        if kernel_size.size is KernelSize.ONE_VCORE:
             if not location.is_vcore:
                 return False
             if not self._is_vcore_free(x, y, location.vcore):
@@ -1,6 +1,7 @@
 from typing import Dict, List, Optional, Tuple, Any
 import math
 from enum import Enum
+import numpy as np
 from hw_resources import ResourceScope, NOCBroadCastResource, AXI2AHBResource
 from kernel_types import (
     BufferLocationType, ChannelType, KernelSize, AllocationType,
@@ -10,6 +11,18 @@ from kernel_types import (
 from bird import BirdCommandSequence, NetworkType, BroadcastType, GridDestinationType, BirdCommand, BirdCommandType
 from apb_config import config_vcore, broadcast_config, barrier_config
 
+def _location_base_addresses(locations: List[KernelLocation]) -> List[int]:
+    """Compute the APB base address for each kernel location in one
+    vectorized pass instead of per-location Python arithmetic."""
+    n = len(locations)
+    xs = np.fromiter((loc.x for loc in locations), dtype=np.int64, count=n)
+    ys = np.fromiter((loc.y for loc in locations), dtype=np.int64, count=n)
+    vcores = np.fromiter((loc.vcore if loc.vcore is not None else 0 for loc in locations),
+                         dtype=np.int64, count=n)
+    addrs = 0x50000000 + xs * 0x10000 + ys * 0x1000 + vcores * 0x100
+    return addrs.tolist()
+
+
 class HWComponent:
     """Base class for hardware components"""
 
@@ -98,7 +111,7 @@ class IOChannel(HWComponent):
         requirements = []
 
         # Determine the appropriate scope and quantity based on buffer location
-        if self.buffer_location == BufferLocationType.MSS000:
+        if self.buffer_location is BufferLocationType.MSS000:
             # Single memory block in MSS000
             requirements.append(MemoryRequirement(
                 size=self.buffer_size * self.num_buffers,
@@ -106,18 +119,18 @@ class IOChannel(HWComponent):
             ))
 
             # DMA requirements
-            if self.channel_type in [ChannelType.PACKED_BUFFER_QUEUE_INPUT, ChannelType.BUFFER_QUEUE_INPUT]:
+            if self.channel_type in (ChannelType.PACKED_BUFFER_QUEUE_INPUT, ChannelType.BUFFER_QUEUE_INPUT):
                 requirements.append(DMARequirement(
                     scope=ResourceScope.ONE_MSS,
                     is_input=True
                 ))
-            elif self.channel_type in [ChannelType.PACKED_BUFFER_QUEUE_OUTPUT, ChannelType.BUFFER_QUEUE_OUTPUT]:
+            elif self.channel_type in (ChannelType.PACKED_BUFFER_QUEUE_OUTPUT, ChannelType.BUFFER_QUEUE_OUTPUT):
                 requirements.append(DMARequirement(
                     scope=ResourceScope.ONE_MSS,
                     is_input=False
                 ))
 
-        elif self.buffer_location == BufferLocationType.PE00:
+        elif self.buffer_location is BufferLocationType.PE00:
             # Split across 4 MSS
             for _ in range(4):
                 requirements.append(MemoryRequirement(
@@ -126,20 +139,20 @@ class IOChannel(HWComponent):
                 ))
 
             # DMA requirements
-            if self.channel_type in [ChannelType.PACKED_BUFFER_QUEUE_INPUT, ChannelType.BUFFER_QUEUE_INPUT]:
+            if self.channel_type in (ChannelType.PACKED_BUFFER_QUEUE_INPUT, ChannelType.BUFFER_QUEUE_INPUT):
                 for _ in range(4):
                     requirements.append(DMARequirement(
                         scope=ResourceScope.ONE_MSS,
                         is_input=True
                     ))
-            elif self.channel_type in [ChannelType.PACKED_BUFFER_QUEUE_OUTPUT, ChannelType.BUFFER_QUEUE_OUTPUT]:
+            elif self.channel_type in (ChannelType.PACKED_BUFFER_QUEUE_OUTPUT, ChannelType.BUFFER_QUEUE_OUTPUT):
                 for _ in range(4):
                     requirements.append(DMARequirement(
                         scope=ResourceScope.ONE_MSS,
                         is_input=False
                     ))
 
-        elif self.buffer_location == BufferLocationType.SPREAD:
+        elif self.buffer_location is BufferLocationType.SPREAD:
             # Evenly distributed across all MSS
             # For simplicity, assuming 8 MSS
             for _ in range(8):
@@ -149,13 +162,13 @@ class IOChannel(HWComponent):
                 ))
 
             # DMA requirements
-            if self.channel_type in [ChannelType.PACKED_BUFFER_QUEUE_INPUT, ChannelType.BUFFER_QUEUE_INPUT]:
+            if self.channel_type in (ChannelType.PACKED_BUFFER_QUEUE_INPUT, ChannelType.BUFFER_QUEUE_INPUT):
                 for _ in range(8):
                     requirements.append(DMARequirement(
                         scope=ResourceScope.ONE_MSS,
                         is_input=True
                     ))
-            elif self.channel_type in [ChannelType.PACKED_BUFFER_QUEUE_OUTPUT, ChannelType.BUFFER_QUEUE_OUTPUT]:
+            elif self.channel_type in (ChannelType.PACKED_BUFFER_QUEUE_OUTPUT, ChannelType.BUFFER_QUEUE_OUTPUT):
                 for _ in range(8):
                     requirements.append(DMARequirement(
                         scope=ResourceScope.ONE_MSS,
@@ -163,7 +176,7 @@ class IOChannel(HWComponent):
                     ))
 
         # Add barrier requirements for auxiliary channels
-        if self.channel_type == ChannelType.AUXILIARY_INPUT:
+        if self.channel_type is ChannelType.AUXILIARY_INPUT:
             requirements.append(BarrierRequirement(
                 scope=ResourceScope.PE_GROUP,
                 count=1
@@ -180,7 +193,7 @@ class IOChannel(HWComponent):
         if self.element_fields and self.element_type:
             defs[f"{self.name.upper()}_ELEMENT_TYPE"] = self.element_type
 
-            if self.channel_type in [ChannelType.PACKED_BUFFER_QUEUE_INPUT, ChannelType.PACKED_BUFFER_QUEUE_OUTPUT]:
+            if self.channel_type in (ChannelType.PACKED_BUFFER_QUEUE_INPUT, ChannelType.PACKED_BUFFER_QUEUE_OUTPUT):
                 defs[f"{self.name.upper()}_ELEMENTS_PER_BUFFER"] = self.buffer_size // self.element_size
 
         # Add struct definition if element fields are provided
@@ -202,21 +215,17 @@ class IOChannel(HWComponent):
         )
 
         # Apply settings for each location in the supergroup
-        for location in supergroup.get_kernel_locations():
-            base_address = 0x50000000 + (location.x * 0x10000) + (location.y * 0x1000)
-            if location.is_vcore:
-                base_address += location.vcore * 0x100
-
+        for base_address in _location_base_addresses(supergroup.get_kernel_locations()):
             # Channel type configuration
             channel_type_val = self.channel_type.value
             seq.add_single_command(base_address + 0x100, channel_type_val.__hash__() & 0xFFFFFFFF)
 
             # Buffer location configuration
-            if self.buffer_location == BufferLocationType.MSS000:
+            if self.buffer_location is BufferLocationType.MSS000:
                 seq.add_single_command(base_address + 0x104, 0x1)
-            elif self.buffer_location == BufferLocationType.PE00:
+            elif self.buffer_location is BufferLocationType.PE00:
                 seq.add_single_command(base_address + 0x104, 0x2)
-            elif self.buffer_location == BufferLocationType.SPREAD:
+            elif self.buffer_location is BufferLocationType.SPREAD:
                 seq.add_single_command(base_address + 0x104, 0x3)
 
             # Buffer size and count
@@ -241,21 +250,21 @@ class VariableResidentData(HWComponent):
     def get_required_resources(self) -> List[ResourceRequirement]:
         requirements = []
 
-        if self.allocation_type == AllocationType.MSS_DUPLICATED:
+        if self.allocation_type is AllocationType.MSS_DUPLICATED:
             # Duplicated across MSS, split in 2 parts
             for _ in range(2):
                 requirements.append(MemoryRequirement(
                     size=self.total_size // 2,
                     scope=ResourceScope.ONE_MSS
                 ))
-        elif self.allocation_type == AllocationType.PE_DUPLICATED:
+        elif self.allocation_type is AllocationType.PE_DUPLICATED:
             # Duplicated across PE, split in 8 parts
             for _ in range(8):
                 requirements.append(MemoryRequirement(
                     size=self.total_size // 8,
                     scope=ResourceScope.ONE_PE
                 ))
-        elif self.allocation_type == AllocationType.MSS_DISTRIBUTED:
+        elif self.allocation_type is AllocationType.MSS_DISTRIBUTED:
             # Distributed across MSS
             # Assuming 8 MSS for this example, with even distribution
             for _ in range(8):
@@ -263,7 +272,7 @@ class VariableResidentData(HWComponent):
                     size=self.total_size // 8,
                     scope=ResourceScope.ONE_MSS
                 ))
-        elif self.allocation_type == AllocationType.PE_DISTRIBUTED:
+        elif self.allocation_type is AllocationType.PE_DISTRIBUTED:
             # Distributed across PE
             # Assuming 16 PEs (4x4) for this example
             for _ in range(16):
@@ -276,7 +285,7 @@ class VariableResidentData(HWComponent):
         if self.dma_channel_required:
             if self.allocation_type in [AllocationType.MSS_DUPLICATED, AllocationType.MSS_DISTRIBUTED]:
                 # Need DMA channels for each MSS
-                count = 2 if self.allocation_type == AllocationType.MSS_DUPLICATED else 8
+                count = 2 if self.allocation_type is AllocationType.MSS_DUPLICATED else 8
                 for _ in range(count):
                     requirements.append(DMARequirement(
                         scope=ResourceScope.ONE_MSS,
@@ -284,7 +293,7 @@ class VariableResidentData(HWComponent):
                     ))
             elif self.allocation_type in [AllocationType.PE_DUPLICATED, AllocationType.PE_DISTRIBUTED]:
                 # Need DMA channels for each PE
-                count = 8 if self.allocation_type == AllocationType.PE_DUPLICATED else 16
+                count = 8 if self.allocation_type is AllocationType.PE_DUPLICATED else 16
                 for _ in range(count):
                     requirements.append(DMARequirement(
                         scope=ResourceScope.ONE_PE,
@@ -300,7 +309,7 @@ class VariableResidentData(HWComponent):
         }
 
         # Add allocation type specific definitions
-        if self.allocation_type == AllocationType.MSS_DUPLICATED:
+        if self.allocation_type is AllocationType.MSS_DUPLICATED:
             defs[f"{self.name.upper()}_MSS_DUPLICATED"] = 1
             # In a real implementation, these would be filled with actual addresses
             defs[f"{self.name.upper()}_START_ADDR0"] = 0  # Placeholder
@@ -308,20 +317,20 @@ class VariableResidentData(HWComponent):
             defs[f"{self.name.upper()}_LEN0"] = self.total_size // 2
             defs[f"{self.name.upper()}_LEN1"] = self.total_size // 2
 
-        elif self.allocation_type == AllocationType.PE_DUPLICATED:
+        elif self.allocation_type is AllocationType.PE_DUPLICATED:
             defs[f"{self.name.upper()}_PE_DUPLICATED"] = 1
             for i in range(8):
                 defs[f"{self.name.upper()}_START_ADDR{i}"] = 0  # Placeholder
                 defs[f"{self.name.upper()}_LEN{i}"] = self.total_size // 8
 
-        elif self.allocation_type == AllocationType.MSS_DISTRIBUTED:
+        elif self.allocation_type is AllocationType.MSS_DISTRIBUTED:
             defs[f"{self.name.upper()}_MSS_DISTRIBUTED"] = 1
             for i in range(2):  # Simplified to 2 for this example
                 defs[f"{self.name.upper()}_START_ADDR{i}"] = 0  # Placeholder
                 defs[f"{self.name.upper()}_LEN{i}"] = self.total_size // 2
                 defs[f"{self.name.upper()}_LAST_MSS_LEN{i}"] = self.total_size // 2
 
-        elif self.allocation_type == AllocationType.PE_DISTRIBUTED:
+        elif self.allocation_type is AllocationType.PE_DISTRIBUTED:
             defs[f"{self.name.upper()}_PE_DISTRIBUTED"] = 1
             for i in range(8):  # Simplified to 8 for this example
                 defs[f"{self.name.upper()}_START_ADDR{i}"] = 0  # Placeholder
@@ -339,24 +348,20 @@ class VariableResidentData(HWComponent):
         )
 
         # Apply settings for each location in the supergroup
-        for location in supergroup.get_kernel_locations():
-            base_address = 0x50000000 + (location.x * 0x10000) + (location.y * 0x1000)
-            if location.is_vcore:
-                base_address += location.vcore * 0x100
-
+        for base_address in _location_base_addresses(supergroup.get_kernel_locations()):
             # Element size and count
             seq.add_single_command(base_address + 0x200, self.element_size)
             seq.add_single_command(base_address + 0x204, self.num_elements)
 
             # Allocation type
             alloc_type_val = 0
-            if self.allocation_type == AllocationType.MSS_DUPLICATED:
+            if self.allocation_type is AllocationType.MSS_DUPLICATED:
                 alloc_type_val = 1
-            elif self.allocation_type == AllocationType.PE_DUPLICATED:
+            elif self.allocation_type is AllocationType.PE_DUPLICATED:
                 alloc_type_val = 2
-            elif self.allocation_type == AllocationType.MSS_DISTRIBUTED:
+            elif self.allocation_type is AllocationType.MSS_DISTRIBUTED:
                 alloc_type_val = 3
-            elif self.allocation_type == AllocationType.PE_DISTRIBUTED:
+            elif self.allocation_type is AllocationType.PE_DISTRIBUTED:
                 alloc_type_val = 4
             seq.add_single_command(base_address + 0x208, alloc_type_val)
 
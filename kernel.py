@@ -1,5 +1,11 @@
 import json
 from typing import Dict, List, Any, Tuple, Optional
+import numpy as np
+
+try:
+    import orjson  # C-implemented writer, much faster on large configs
+except ImportError:
+    orjson = None
 from hw_components import HWComponent, KernelSizeComponent, IOChannel, VariableResidentData, KernelSuperGroup
 from kernel_types import KernelSize, KernelLocation
 from resource_allocators import MemoryAllocator
@@ -29,15 +35,43 @@ class Kernel:
         self.other_components: List[HWComponent] = []
         self.allocated_resources: Dict[str, Any] = {}
         self.memory_allocator = MemoryAllocator(self.size_component)
+        self._components_cache: Optional[Tuple[HWComponent, ...]] = None
+        self._h_file_cache: Optional[str] = None
+
+    def _all_components(self) -> Tuple[HWComponent, ...]:
+        """Return all components as a cached tuple.
+
+        The tuple is rebuilt lazily after add_io_channel/add_vrd/add_component
+        invalidate the cache, so repeated codegen calls don't re-concatenate
+        the component lists.
+        """
+        if self._components_cache is None:
+            self._components_cache = (self.size_component,) + tuple(self.io_channels) \
+                + tuple(self.vrd_components) + tuple(self.other_components)
+        return self._components_cache
+
+    def _invalidate_allocation(self):
+        """Force re-allocation after the component set changes"""
+        self.allocated = False
+        self.allocated_resources.clear()
 
     def add_io_channel(self, channel: IOChannel):
         self.io_channels.append(channel)
+        self._components_cache = None
+        self._h_file_cache = None
+        self._invalidate_allocation()
 
     def add_vrd(self, vrd: VariableResidentData):
         self.vrd_components.append(vrd)
+        self._components_cache = None
+        self._h_file_cache = None
+        self._invalidate_allocation()
 
     def add_component(self, component: HWComponent):
         self.other_components.append(component)
+        self._components_cache = None
+        self._h_file_cache = None
+        self._invalidate_allocation()
 
     def add_binary(self, binary: KernelBinary):
         """Add a binary (PM, DM, VM) to this kernel.
@@ -46,23 +80,26 @@ class Kernel:
             binary: KernelBinaryType instance containing the binary data
         """
         self.binaries.append(binary)
+        self._invalidate_allocation()
 
     def allocate_resources(self):
         """Allocate resources for all components"""
         self.allocated = True
+        self._h_file_cache = None
         self.memory_allocator.reset()
 
         # Get all components
-        all_components = [self.size_component] + self.io_channels + self.vrd_components + self.other_components
+        all_components = self._all_components()
 
-        # Allocate resources for each component
+        # Allocate resources for each component into one flat list per
+        # component. The allocator returns a (possibly empty) list per
+        # requirement; extending keeps a single resource list alive instead
+        # of nesting a fresh list per requirement.
         for component in all_components:
-            requirements = component.get_required_resources()
             resources = []
 
-            for req in requirements:
-                res = self.memory_allocator.allocate(req)
-                resources.append(res)
+            for req in component.get_required_resources():
+                resources.extend(self.memory_allocator.allocate(req))
 
             if resources:
                 self.allocated_resources[component.name] = resources
@@ -73,6 +110,11 @@ class Kernel:
         Returns:
             str: The complete header file content
         """
+        # Content is deterministic for a given set of components and
+        # allocations; reuse it until add_* or allocate_resources invalidate.
+        if self._h_file_cache is not None:
+            return self._h_file_cache
+
         lines = []
         lines.append("// Automatically generated kernel configuration")
         lines.append(f"// Kernel: {self.name}\n")
@@ -83,45 +125,59 @@ class Kernel:
         lines.append("#include <stdint.h>\n")
 
         # Get all components
-        all_components = [self.size_component] + self.io_channels + self.vrd_components + self.other_components
+        all_components = self._all_components()
 
         # Generate defines for each component
         for component in all_components:
             lines.append(f"// {component.name} configuration")
 
-            # Get all definitions
+            # Get all definitions and split them in one pass without
+            # mutating the component's dict, so components are free to
+            # return a cached mapping.
             defs = component.get_h_file_definitions()
+            struct_items = []
+            regular_items = []
+            for key, value in defs.items():
+                (struct_items if key.startswith("STRUCT_") else regular_items).append((key, value))
 
             # Write struct definitions first if present
-            struct_keys = [k for k in defs.keys() if k.startswith("STRUCT_")]
-            for key in struct_keys:
-                lines.append(f"{defs[key]}")
-                del defs[key]  # Remove to avoid duplication
+            for _, value in struct_items:
+                lines.append(f"{value}")
 
             # Write regular defines
-            for key, value in defs.items():
-                if isinstance(value, str):
-                    lines.append(f"#define {key} {value}")
-                else:
-                    lines.append(f"#define {key} {value}")
+            for key, value in regular_items:
+                lines.append(f"#define {key} {value}")
 
             lines.append("")  # Empty line between components
 
         # Add resource allocations
         lines.append("// Resource allocations")
         for component_name, resources in self.allocated_resources.items():
+            upper_name = component_name.upper()  # hoisted out of the resource loop
             lines.append(f"// Resources for {component_name}")
-            for i, resource in enumerate(resources):
-                if isinstance(resource, MemoryResource):
-                    lines.append(f"#define {component_name.upper()}_ADDR{i} 0x{resource.address:08x}")
-                    lines.append(f"#define {component_name.upper()}_SIZE{i} {resource.length}")
-                    lines.append(f"#define {component_name.upper()}_END{i} 0x{resource.address + resource.length:08x}")
+            mem_resources = [(i, r) for i, r in enumerate(resources)
+                             if isinstance(r, MemoryResource)]
+            if mem_resources:
+                # Format all addresses for this component in one numpy call
+                # instead of three f-string formats per resource.
+                count = len(mem_resources)
+                addrs = np.fromiter((r.address for _, r in mem_resources),
+                                    dtype=np.int64, count=count)
+                lengths = np.fromiter((r.length for _, r in mem_resources),
+                                      dtype=np.int64, count=count)
+                addr_strs = np.char.mod('0x%08x', addrs)
+                end_strs = np.char.mod('0x%08x', addrs + lengths)
+                for (i, resource), addr_str, end_str in zip(mem_resources, addr_strs, end_strs):
+                    lines.append(f"#define {upper_name}_ADDR{i} {addr_str}")
+                    lines.append(f"#define {upper_name}_SIZE{i} {resource.length}")
+                    lines.append(f"#define {upper_name}_END{i} {end_str}")
             lines.append("")  # Empty line between components
 
         lines.append("#endif // __KERNEL_CONFIG_H__")
 
         # Join all lines with newlines
-        return "\n".join(lines)
+        self._h_file_cache = "\n".join(lines)
+        return self._h_file_cache
 
   
 
@@ -140,33 +196,31 @@ class Kernel:
         if len(self.binaries) == 0:
             raise RuntimeError(f"Kernel {self.name} is not built. Add PM binary before deployment.")
 
-        # Allocate resources first
-        self.allocate_resources()
+        # Allocate resources first (skipped when the component set hasn't
+        # changed since the last allocation)
+        if not self.allocated:
+            self.allocate_resources()
 
-        sequences = []
-
-        # Add APB settings for all components
-        all_components = [self.size_component] + self.io_channels + self.vrd_components + self.other_components
-        for component in all_components:
-            sequences.append(component.get_apb_settings(supergroup))
+        # Build the sequence list in bulk: APB settings for all components,
+        # then binaries, then VRD entries, letting each batch be constructed
+        # in a single comprehension instead of per-item appends.
+        sequences = [component.get_apb_settings(supergroup)
+                     for component in self._all_components()]
 
         # Add all binaries
-        for binary in self.binaries:
-            sequences.append(binary.generate_bird_sequence())
-
-        # Add VRD entries
-        for vrd in self.vrd_components:
-            if vrd.name in self.allocated_resources:
-                resources = self.allocated_resources[vrd.name]
-                for i, resource in enumerate(resources):
-                    if isinstance(resource, MemoryResource):
-                        vrd_seq = BirdCommandSequence(
-                            description=f"VRD {vrd.name}_{i} for {self.name}",
-                            network_type=NetworkType(BroadcastType.SUPER_MSS_BRCST, GridDestinationType.MSS),
-                            commands=[]
-                        )
-                        # Add VRD data commands...
-                        sequences.append(vrd_seq)
+        sequences.extend(binary.generate_bird_sequence() for binary in self.binaries)
+
+        # Add VRD entries (data commands added downstream)
+        sequences.extend(
+            BirdCommandSequence(
+                description=f"VRD {vrd.name}_{i} for {self.name}",
+                network_type=NetworkType(BroadcastType.SUPER_MSS_BRCST, GridDestinationType.MSS),
+                commands=[]
+            )
+            for vrd in self.vrd_components
+            for i, resource in enumerate(self.allocated_resources.get(vrd.name, ()))
+            if isinstance(resource, MemoryResource)
+        )
 
         return sequences
 
@@ -211,9 +265,14 @@ class Kernel:
 
             config["vrd_components"].append(vrd_config)
 
-        # Save to file
-        with open(output_file, 'w') as f:
-            json.dump(config, f, indent=4)
+        # Save to file; config holds only plain values (enums are already
+        # converted via .value above), so orjson can serialize it directly.
+        if orjson is not None:
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+        else:
+            with open(output_file, 'w') as f:
+                json.dump(config, f, indent=4)
 
     @classmethod
     def load_from_json(cls, input_file: str):
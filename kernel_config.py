@@ -1,7 +1,10 @@
 #!/usr/bin/env python3
 
+import functools
 import json
 import pytest
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
 from typing import Dict, List, Tuple, Any
 from grid import Chip, Haps
 from kernel import Kernel
@@ -12,32 +15,48 @@ from kernel_binary_parser import KernelBinary
 
 # Create sample binaries
 # Simple binary patterns for demonstration
-g_vcore_pm = KernelBinary.from_file('./kernels/kern-gs.vcore.elf.ePM')
-g_vcore_vm = KernelBinary.from_file('./kernels/kern-gs.vcore.elf.eVM')
-g_vcore_dm = KernelBinary.from_file('./kernels/kern-gs.vcore.elf.eDMw')
-s_ncore_pm = KernelBinary.from_file('./kernels/ncore-grid.ncore.elf.ePM')
-s_ncore_dm = KernelBinary.from_file('./kernels/ncore-grid.ncore.elf.ePM')
+@functools.cache
+def _binaries() -> SimpleNamespace:
+    """Sample binaries, loaded on first use instead of at import time so
+    collecting these tests does no binary parsing."""
+    binaries = SimpleNamespace(
+        g_vcore_pm=KernelBinary.from_file('./kernels/kern-gs.vcore.elf.ePM'),
+        g_vcore_vm=KernelBinary.from_file('./kernels/kern-gs.vcore.elf.eVM'),
+        g_vcore_dm=KernelBinary.from_file('./kernels/kern-gs.vcore.elf.eDMw'),
+        s_ncore_pm=KernelBinary.from_file('./kernels/ncore-grid.ncore.elf.ePM'),
+        s_ncore_dm=KernelBinary.from_file('./kernels/ncore-grid.ncore.elf.ePM'),
+    )
+    # The images are independent, so warm their decode caches concurrently;
+    # file reads overlap instead of running back to back.
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        list(executor.map(lambda binary: binary.contents, vars(binaries).values()))
+    return binaries
 
 
-# Initialize kernels
-kernel_g = Kernel("G_Kernel", KernelSize.SIZE_2X2)
-kernel_s = Kernel("S_Kernel", KernelSize.ONE_VCORE)
-kernel_4x4 = Kernel("G_large", KernelSize.SIZE_4X4)
+@functools.cache
+def _kernels() -> SimpleNamespace:
+    """Sample kernels with their binaries loaded, built on first use."""
+    binaries = _binaries()
 
-# Load binaries into kernels
-kernel_g.add_binary(g_vcore_pm)
-kernel_g.add_binary(g_vcore_dm)
-kernel_s.add_binary(s_ncore_dm)
-kernel_s.add_binary(s_ncore_pm)
-kernel_4x4.add_binary(g_vcore_pm)
+    kernel_g = Kernel("G_Kernel", KernelSize.SIZE_2X2)
+    kernel_s = Kernel("S_Kernel", KernelSize.ONE_VCORE)
+    kernel_4x4 = Kernel("G_large", KernelSize.SIZE_4X4)
+
+    kernel_g.add_binary(binaries.g_vcore_pm)
+    kernel_g.add_binary(binaries.g_vcore_dm)
+    kernel_s.add_binary(binaries.s_ncore_dm)
+    kernel_s.add_binary(binaries.s_ncore_pm)
+    kernel_4x4.add_binary(binaries.g_vcore_pm)
+
+    return SimpleNamespace(kernel_g=kernel_g, kernel_s=kernel_s, kernel_4x4=kernel_4x4)
 
 def test_haps_g_single():
     app = Application("ExampleApp", Haps())
     
     # Create a 2x2 supergroup for the 2x2 kernel at (0,0)
     g_supergroup = KernelSuperGroup(x=0, y=0, size_x=2, size_y=2, kernel_size=KernelSize.SIZE_2X2)
-    app.add_kernel(kernel_g, g_supergroup)
-    
+    app.add_kernel(_kernels().kernel_g, g_supergroup)
+
     sequences = app.generate_bird_sequence()
     for sequence in sequences:
         print(sequence)
@@ -50,7 +69,7 @@ def test_full_chip_g_single():
     
     # Create a 16x16 supergroup for the 2x2 kernel at (0,0)
     g_supergroup = KernelSuperGroup(x=0, y=0, size_x=16, size_y=16, kernel_size=KernelSize.SIZE_2X2)
-    app.add_kernel(kernel_g, g_supergroup)
+    app.add_kernel(_kernels().kernel_g, g_supergroup)
         
     print(app.generate_bird_sequence())
     assert True
@@ -64,8 +83,9 @@ def test_haps_gs():
     # Create a 2x2 supergroup for the vcore kernel at (2,0)
     s_supergroup = KernelSuperGroup(x=2, y=0, size_x=2, size_y=2, kernel_size=KernelSize.ONE_VCORE)
 
-    app.add_kernel(kernel_g, g_supergroup)
-    app.add_kernel(kernel_s, s_supergroup)
+    kernels = _kernels()
+    app.add_kernel(kernels.kernel_g, g_supergroup)
+    app.add_kernel(kernels.kernel_s, s_supergroup)
         
     print(app.generate_bird_sequence())
     assert True
@@ -79,7 +99,7 @@ def example_application():
     
     # Create and add first kernel (4x4)
     kernel1 = Kernel("ExampleKernel1", KernelSize.SIZE_4X4)
-    kernel1.add_binary(g_vcore_pm)
+    kernel1.add_binary(_binaries().g_vcore_pm)
     
     # Create a 8x8 supergroup for the 4x4 kernel at (0,0)
     supergroup1 = KernelSuperGroup(x=0, y=0, size_x=8, size_y=8, kernel_size=KernelSize.SIZE_4X4)
@@ -90,7 +110,7 @@ def example_application():
         
     # Create and add a vcore kernel
     kernel2 = Kernel("ExampleKernel2", KernelSize.ONE_VCORE)
-    kernel2.add_binary(s_ncore_pm)
+    kernel2.add_binary(_binaries().s_ncore_pm)
     
     # Create a 1x1 supergroup for the vcore kernel at (8,8)
     supergroup2 = KernelSuperGroup(x=8, y=8, size_x=1, size_y=1, kernel_size=KernelSize.ONE_VCORE)
@@ -1,6 +1,10 @@
-from enum import Enum
+from enum import Enum, IntEnum
+from itertools import product
 from typing import Dict, List, Optional, Tuple, Union, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+
+import numpy as np
+
 from hw_resources import ResourceScope
 
 
@@ -18,18 +22,49 @@ class KernelSize(Enum):
     SIZE_16X16 = "16x16"
 
 
-@dataclass
+# (x, y) grid dimensions per kernel size, built once at import instead of
+# per _get_kernel_dimensions call.
+_KERNEL_DIMS = {
+    KernelSize.ONE_VCORE: (1, 1),
+    KernelSize.SIZE_1X1: (1, 1),
+    KernelSize.SIZE_1X2: (1, 2),
+    KernelSize.SIZE_2X2: (2, 2),
+    KernelSize.SIZE_2X4: (2, 4),
+    KernelSize.SIZE_4X4: (4, 4),
+    KernelSize.SIZE_4X8: (4, 8),
+    KernelSize.SIZE_8X8: (8, 8),
+    KernelSize.SIZE_8X16: (8, 16),
+    KernelSize.SIZE_16X16: (16, 16),
+}
+
+# Kernel dims plus their low-bit masks; dims are powers of 2, so
+# "multiple of kernel size" reduces to a mask test against kx-1/ky-1.
+_KERNEL_META = {size: (kx, ky, kx - 1, ky - 1)
+                for size, (kx, ky) in _KERNEL_DIMS.items()}
+
+
+@dataclass(frozen=True, slots=True)
 class KernelLocation:
     """Represents a kernel location in the grid.
     For regular kernels (1x1 or larger), only x and y are used.
-    For ONE_VCORE kernels, x, y, and vcore are used."""
+    For ONE_VCORE kernels, x, y, and vcore are used.
+    Frozen, so locations hash and compare via their coordinates and can
+    key placement sets and dicts directly."""
     x: int
     y: int
     vcore: Optional[int] = None
+    _str: str = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         if self.vcore is not None and not (0 <= self.vcore < 4):
             raise ValueError("vcore must be between 0 and 3")
+        # Formatted once here so serialization loops that stringify
+        # thousands of locations don't re-run the f-string per call.
+        # (object.__setattr__ because the dataclass is frozen.)
+        if self.vcore is not None:
+            object.__setattr__(self, '_str', f"({self.x}, {self.y}, vcore{self.vcore})")
+        else:
+            object.__setattr__(self, '_str', f"({self.x}, {self.y})")
 
     @property
     def is_vcore(self) -> bool:
@@ -37,9 +72,7 @@ class KernelLocation:
         return self.vcore is not None
 
     def __str__(self) -> str:
-        if self.is_vcore:
-            return f"({self.x}, {self.y}, vcore{self.vcore})"
-        return f"({self.x}, {self.y})"
+        return self._str
 
 
 @dataclass
@@ -53,53 +86,73 @@ class KernelSuperGroup:
     kernel_size: KernelSize
 
     def __post_init__(self):
+        # Kernel dimensions, kept on self so later calls skip the lookup
+        self.kernel_x, self.kernel_y, mask_x, mask_y = _KERNEL_META[self.kernel_size]
+        # Location list and coordinate arrays, built lazily; the
+        # supergroup's fields never change after construction, so
+        # multi-pass callers share one copy of each.
+        self._locations: Optional[List[KernelLocation]] = None
+        self._location_arrays: Optional[Tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]] = None
+
         # Check if sizes are powers of 2
-        if not (self.size_x > 0 and (self.size_x & (self.size_x - 1) == 0)):
+        if self.size_x <= 0 or self.size_x & (self.size_x - 1):
             raise ValueError(f"size_x must be a power of 2, got {self.size_x}")
-        if not (self.size_y > 0 and (self.size_y & (self.size_y - 1) == 0)):
+        if self.size_y <= 0 or self.size_y & (self.size_y - 1):
             raise ValueError(f"size_y must be a power of 2, got {self.size_y}")
 
-        # Get kernel dimensions
-        kernel_x, kernel_y = self._get_kernel_dimensions()
-        
-        # Check if supergroup size is compatible with kernel size
-        if self.size_x % kernel_x != 0 or self.size_y % kernel_y != 0:
-            raise ValueError(f"Supergroup size ({self.size_x}x{self.size_y}) must be multiple of kernel size ({kernel_x}x{kernel_y})")
+        # Check if supergroup size is compatible with kernel size; kernel
+        # dims are powers of 2, so the multiple test is a bitmask
+        if self.size_x & mask_x or self.size_y & mask_y:
+            raise ValueError(f"Supergroup size ({self.size_x}x{self.size_y}) must be multiple of kernel size ({self.kernel_x}x{self.kernel_y})")
 
     def _get_kernel_dimensions(self) -> Tuple[int, int]:
         """Get the x and y dimensions of the kernel based on its size"""
-        size_mapping = {
-            KernelSize.ONE_VCORE: (1, 1),
-            KernelSize.SIZE_1X1: (1, 1),
-            KernelSize.SIZE_1X2: (1, 2),
-            KernelSize.SIZE_2X2: (2, 2),
-            KernelSize.SIZE_2X4: (2, 4),
-            KernelSize.SIZE_4X4: (4, 4),
-            KernelSize.SIZE_4X8: (4, 8),
-            KernelSize.SIZE_8X8: (8, 8),
-            KernelSize.SIZE_8X16: (8, 16),
-            KernelSize.SIZE_16X16: (16, 16),
-        }
-        return size_mapping[self.kernel_size]
+        return _KERNEL_DIMS[self.kernel_size]
 
     def get_kernel_locations(self) -> List[KernelLocation]:
         """Get all kernel locations within this supergroup"""
-        kernel_x, kernel_y = self._get_kernel_dimensions()
-        locations = []
+        if self._locations is not None:
+            return self._locations
 
+        # Build each list in a single comprehension so the result list is
+        # grown once instead of via per-location append calls.
         # For regular kernels
-        if self.kernel_size != KernelSize.ONE_VCORE:
-            for x in range(self.x, self.x + self.size_x, kernel_x):
-                for y in range(self.y, self.y + self.size_y, kernel_y):
-                    locations.append(KernelLocation(x, y))
-        # For vcore kernels
+        if self.kernel_size is not KernelSize.ONE_VCORE:
+            self._locations = [KernelLocation(x, y)
+                               for x in range(self.x, self.x + self.size_x, self.kernel_x)
+                               for y in range(self.y, self.y + self.size_y, self.kernel_y)]
         else:
-            for x in range(self.x, self.x + self.size_x):
-                for y in range(self.y, self.y + self.size_y):
-                    for vcore in range(4):  # All 4 vcores
-                        locations.append(KernelLocation(x, y, vcore))
-
-        return locations
+            # For vcore kernels: product drives the x/y/vcore iteration in C
+            self._locations = [KernelLocation(x, y, vcore)
+                               for x, y, vcore in product(range(self.x, self.x + self.size_x),
+                                                          range(self.y, self.y + self.size_y),
+                                                          range(4))]  # All 4 vcores
+        return self._locations
+
+    def get_kernel_locations_arrays(self) -> Tuple[np.ndarray, np.ndarray, Optional[np.ndarray]]:
+        """Get all kernel locations as coordinate arrays (xs, ys, vcores).
+
+        Array-of-coordinates companion to get_kernel_locations for callers
+        that only need the numbers: the grid is built with arange/meshgrid
+        instead of allocating one KernelLocation per cell. Ordering matches
+        get_kernel_locations (x outer, y inner, vcore innermost); vcores is
+        None for regular kernels."""
+        if self._location_arrays is not None:
+            return self._location_arrays
+
+        if self.kernel_size is not KernelSize.ONE_VCORE:
+            xs = np.arange(self.x, self.x + self.size_x, self.kernel_x)
+            ys = np.arange(self.y, self.y + self.size_y, self.kernel_y)
+            grid_x, grid_y = np.meshgrid(xs, ys, indexing='ij')
+            self._location_arrays = (grid_x.ravel(), grid_y.ravel(), None)
+        else:
+            xs = np.arange(self.x, self.x + self.size_x)
+            ys = np.arange(self.y, self.y + self.size_y)
+            grid_x, grid_y = np.meshgrid(xs, ys, indexing='ij')
+            self._location_arrays = (np.repeat(grid_x.ravel(), 4),
+                                     np.repeat(grid_y.ravel(), 4),
+                                     np.tile(np.arange(4), grid_x.size))
+        return self._location_arrays
 
     def __str__(self) -> str:
         return f"KernelSuperGroup at ({self.x}, {self.y}) size {self.size_x}x{self.size_y} for {self.kernel_size.value} kernel"
@@ -127,43 +180,52 @@ class AllocationType(Enum):
     PE_DISTRIBUTED = "PE_Distributed"
 
 
-# Base Resource Requirement class
+class ResourceKind(IntEnum):
+    MEMORY = 0
+    DMA = 1
+    BARRIER = 2
+
+
+# Resource requirements collapsed into one tagged record: components create
+# these in bulk, and a single slotted dataclass with a kind tag is cheaper
+# to build and filter than a subclass per kind. Allocators dispatch on the
+# kind attribute; the factories below keep the old constructor signatures.
+@dataclass(slots=True)
 class ResourceRequirement:
-    def __init__(self, scope: ResourceScope):
-        self.scope = scope
+    kind: ResourceKind
+    scope: ResourceScope
+    size: int = 0
+    count: int = 1
+    is_input: bool = True
 
     def __repr__(self):
-        return f"{self.__class__.__name__}(scope={self.scope})"
+        if self.kind is ResourceKind.MEMORY:
+            return f"MemoryRequirement(size={self.size}, scope={self.scope})"
+        if self.kind is ResourceKind.DMA:
+            return f"DMARequirement(scope={self.scope}, is_input={self.is_input})"
+        return f"BarrierRequirement(scope={self.scope}, count={self.count})"
 
 
-class MemoryRequirement(ResourceRequirement):
-    def __init__(self, size: int, scope: ResourceScope):
-        super().__init__(scope)
-        self.size = size
+def MemoryRequirement(size: int, scope: ResourceScope) -> ResourceRequirement:
+    return ResourceRequirement(ResourceKind.MEMORY, scope, size=size)
 
-    def __repr__(self):
-        return f"MemoryRequirement(size={self.size}, scope={self.scope})"
 
+def DMARequirement(scope: ResourceScope, is_input: bool = True) -> ResourceRequirement:
+    return ResourceRequirement(ResourceKind.DMA, scope, is_input=is_input)
 
-class DMARequirement(ResourceRequirement):
-    def __init__(self, scope: ResourceScope, is_input: bool = True):
-        super().__init__(scope)
-        self.is_input = is_input
 
-    def __repr__(self):
-        return f"DMARequirement(scope={self.scope}, is_input={self.is_input})"
+def BarrierRequirement(scope: ResourceScope, count: int = 1) -> ResourceRequirement:
+    return ResourceRequirement(ResourceKind.BARRIER, scope, count=count)
 
 
-class BarrierRequirement(ResourceRequirement):
-    def __init__(self, scope: ResourceScope, count: int = 1):
-        super().__init__(scope)
-        self.count = count
-
-    def __repr__(self):
-        return f"BarrierRequirement(scope={self.scope}, count={self.count})"
+# C type per field size in bytes; sizes beyond the table become byte arrays.
+_C_TYPES = {1: "uint8_t", 2: "uint16_t", 3: "uint32_t", 4: "uint32_t",
+            5: "uint64_t", 6: "uint64_t", 7: "uint64_t", 8: "uint64_t"}
 
 
 class ElementField:
+    __slots__ = ('name', 'size')
+
     def __init__(self, name: str, size: int):
         self.name = name
         self.size = size
@@ -173,13 +235,5 @@ class ElementField:
 
     def get_c_type(self) -> str:
         """Determine C type based on size"""
-        if self.size == 1:
-            return "uint8_t"
-        elif self.size == 2:
-            return "uint16_t"
-        elif self.size <= 4:
-            return "uint32_t"
-        elif self.size <= 8:
-            return "uint64_t"
-        else:
-            return f"uint8_t[{self.size}]" 
\ No newline at end of file
+        c_type = _C_TYPES.get(self.size)
+        return c_type if c_type is not None else f"uint8_t[{self.size}]"
\ No newline at end of file
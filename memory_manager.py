@@ -1,7 +1,13 @@
-from typing import Dict, List, Optional, Tuple, Set, Any
-from dataclasses import dataclass, field
+from typing import ClassVar, Deque, Dict, List, Optional, Tuple, Set, Any
+from dataclasses import dataclass, field, replace
 from enum import Enum
-import copy
+from collections import deque
+from itertools import product
+import bisect
+import heapq
+import sys
+
+import numpy as np
 
 
 class DimensionScope(Enum):
@@ -25,23 +31,73 @@ class RequirementState(Enum):
     FULFILLED = "fulfilled"   # Successfully allocated
 
 
+class OrderStrategy(Enum):
+    SCOPE_FIRST = "scope_first"        # Broadest scopes first (default)
+    GREEDY_BY_SIZE = "greedy_by_size"  # Largest allocations first
+
+
 class AllocationError(Exception):
     """Raised when allocation fails"""
     pass
 
 
-@dataclass(frozen=True)
+# Scope contribution to the requirement ordering key; a SPECIFIC dimension
+# adds one more when its value is still unselected (see get_priority_key)
+_SCOPE_SCORE_BASE = {
+    DimensionScope.ALL: 0,
+    DimensionScope.SPECIFIC: 1,
+    DimensionScope.GROUP: 1,
+}
+
+# Display format per scope; SPECIFIC with no value is the Auto- special
+# case handled in DimensionRequirement.describe
+_SCOPE_DESCRIBE_FMT = {
+    DimensionScope.ALL: "All-{name}",
+    DimensionScope.SPECIFIC: "{name}{value}",
+    DimensionScope.GROUP: "{name}-{group}",
+}
+
+
+@dataclass(frozen=True, slots=True)
 class ResourceCoordinate:
-    """Represents a specific resource in the hierarchy"""
+    """Represents a specific resource in the hierarchy.
+
+    Used for display and external interfaces; internally coordinates are
+    packed ints (see encode_coordinate) so the signature-set algebra runs
+    on small-int hashing instead of dataclass instances."""
     pe: int
     mss: int
     slice: int
-    
+
     def __str__(self):
         return f"({self.pe}, {self.mss}, {self.slice})"
 
 
-@dataclass
+# Packed coordinate layout: pe << 8 | mss << 4 | slice. The 4-bit fields
+# leave headroom over the hardware's 4 MSS per PE and 8 slices per MSS,
+# and a packed small int hashes and compares at C speed. The packed value
+# doubles as the bit position in coordinate-set bitmasks, so a set of
+# coordinates is one arbitrary-precision int and set algebra becomes
+# native AND/OR/AND-NOT on it.
+def encode_coordinate(pe: int, mss: int, slice_id: int) -> int:
+    """Pack a (pe, mss, slice) coordinate into a single int key"""
+    return (pe << 8) | (mss << 4) | slice_id
+
+
+def decode_coordinate(code: int) -> ResourceCoordinate:
+    """Unpack an int key back into a ResourceCoordinate for display"""
+    return ResourceCoordinate(code >> 8, (code >> 4) & 0xF, code & 0xF)
+
+
+def iter_mask_coordinates(mask: int):
+    """Yield the packed coordinate for each set bit in a coordinate mask"""
+    while mask:
+        low_bit = mask & -mask
+        yield low_bit.bit_length() - 1
+        mask ^= low_bit
+
+
+@dataclass(slots=True)
 class AllocationDetails:
     """Details about how a requirement was fulfilled"""
     allocated_address: int
@@ -55,42 +111,95 @@ class AllocationDetails:
         return f"PE{self.resolved_pe}/MSS{self.resolved_mss}/Slice{slice_str} @ 0x{self.allocated_address:08x}"
 
 
-@dataclass
+@dataclass(slots=True)
 class DimensionRequirement:
     scope: DimensionScope
     value: Optional[int] = None
     group: Optional[SliceGroup] = None
-    
+
+    # Memoized get_possible_values result; scope and group never change
+    # after construction, so the cache only needs to drop when the
+    # resolver rewrites value (handled in __setattr__)
+    _cached_values: Optional[Tuple[int, ...]] = field(init=False, default=None,
+                                                      repr=False, compare=False)
+    # Memoized describe() results keyed by dimension name, invalidated
+    # alongside _cached_values
+    _cached_desc: Optional[Dict[str, str]] = field(init=False, default=None,
+                                                   repr=False, compare=False)
+
+    def __setattr__(self, name, new_value):
+        if name == 'value':
+            object.__setattr__(self, '_cached_values', None)
+            object.__setattr__(self, '_cached_desc', None)
+        object.__setattr__(self, name, new_value)
+
     def needs_selection(self) -> bool:
         return self.scope == DimensionScope.SPECIFIC and self.value is None
-    
-    def get_possible_values(self, dimension_size: int) -> List[int]:
+
+    def describe(self, dim_name: str) -> str:
+        """Human-readable scope description, memoized per dimension name"""
+        if self._cached_desc is not None:
+            cached = self._cached_desc.get(dim_name)
+            if cached is not None:
+                return cached
+        else:
+            self._cached_desc = {}
+
+        if self.needs_selection():
+            desc = f"Auto-{dim_name}"
+        else:
+            fmt = _SCOPE_DESCRIBE_FMT.get(self.scope)
+            if fmt is None:
+                desc = f"Unknown-{dim_name}"
+            else:
+                group_name = self.group.value.replace("group_", "") if self.group is not None else ""
+                desc = fmt.format(name=dim_name, value=self.value, group=group_name)
+        self._cached_desc[dim_name] = desc
+        return desc
+
+    def get_possible_values(self, dimension_size: int) -> Tuple[int, ...]:
         """Get all possible values for this dimension"""
+        if self._cached_values is not None:
+            return self._cached_values
+
         if self.scope == DimensionScope.ALL:
-            return list(range(dimension_size))
+            values = tuple(range(dimension_size))
         elif self.scope == DimensionScope.SPECIFIC:
-            return [self.value] if self.value is not None else list(range(dimension_size))
+            values = (self.value,) if self.value is not None else tuple(range(dimension_size))
         elif self.scope == DimensionScope.GROUP:
-            return self._get_group_values(self.group)
+            values = self._get_group_values(self.group)
         else:
             raise ValueError(f"Unknown scope: {self.scope}")
-    
-    def _get_group_values(self, group: SliceGroup) -> List[int]:
+
+        self._cached_values = values
+        return values
+
+    def _get_group_values(self, group: SliceGroup) -> Tuple[int, ...]:
         if group == SliceGroup.GROUP_0_3:
-            return [0, 1, 2, 3]
+            return (0, 1, 2, 3)
         elif group == SliceGroup.GROUP_4_7:
-            return [4, 5, 6, 7]
+            return (4, 5, 6, 7)
         else:
             raise ValueError(f"Unknown slice group: {group}")
 
 
-@dataclass
+@dataclass(slots=True)
 class MemoryRequirement:
-    # Class variables for dimension sizes (shared across all instances)
-    # These are defined outside dataclass field annotations to be true class variables
-    pe_count = 0
-    mss_per_pe = 0
-    slices_per_mss = 0
+    # Class variables for dimension sizes (shared across all instances);
+    # ClassVar keeps them out of the generated fields and slots
+    pe_count: ClassVar[int] = 0
+    mss_per_pe: ClassVar[int] = 0
+    slices_per_mss: ClassVar[int] = 0
+
+    # Per-dimension bit planes (built in set_system_dimensions):
+    # _pe_value_masks[v] has a bit set for every coordinate whose PE is v,
+    # and likewise for MSS and slice
+    _pe_value_masks: ClassVar[List[int]] = []
+    _mss_value_masks: ClassVar[List[int]] = []
+    _slice_value_masks: ClassVar[List[int]] = []
+
+    # Freelist of released instances reused by acquire(); see release()
+    _pool: ClassVar[List['MemoryRequirement']] = []
     
     # Instance fields
     size: int                              # number of bytes to allocate per slice
@@ -106,10 +215,41 @@ class MemoryRequirement:
     
     # Internal list for algorithm compatibility (auto-generated)
     dimension_reqs: List[DimensionRequirement] = field(init=False)
-    
+
+    # Memoized affected-coordinate set and its bitmask form; reset
+    # whenever a dimension value changes (see UnifiedDimensionResolver)
+    _affected_cache: Optional[frozenset] = field(init=False, default=None, repr=False)
+    _mask_cache: Optional[int] = field(init=False, default=None, repr=False)
+    _priority_cache: Optional[Tuple[int, int, int, int]] = field(init=False, default=None, repr=False)
+
+    # Values fixed at construction, snapshotted so the per-candidate hot
+    # paths don't re-derive them (set_system_dimensions runs at manager
+    # init before any requirement exists, and scopes never change)
+    _dim_sizes: Tuple[int, int, int] = field(init=False, repr=False)
+    _needs_selection: bool = field(init=False, repr=False)
+    _total_size: int = field(init=False, repr=False)
+
     def __post_init__(self):
         """Create internal dimension_reqs list from explicit requirements"""
         self.dimension_reqs = [self.pe_req, self.mss_req, self.slice_req]
+
+        # Interned so the same ID repeated across batches shares one
+        # string object and compares/hashes by pointer in dict lookups
+        self.allocation_id = sys.intern(self.allocation_id)
+
+        self._dim_sizes = (MemoryRequirement.pe_count,
+                           MemoryRequirement.mss_per_pe,
+                           MemoryRequirement.slices_per_mss)
+        self._needs_selection = any(req.needs_selection() for req in self.dimension_reqs)
+
+        # Total coordinates = product of affected counts across all dimensions
+        total_coordinates = 1
+        for i, dim_req in enumerate(self.dimension_reqs):
+            if dim_req.scope == DimensionScope.ALL:
+                total_coordinates *= self._dim_sizes[i]
+            elif dim_req.scope == DimensionScope.GROUP:
+                assert self.allocation_mode == SliceAllocationMode.PARALLEL
+        self._total_size = self.size * total_coordinates
     
     @classmethod
     def set_system_dimensions(cls, pe_count: int, mss_per_pe: int, slices_per_mss: int):
@@ -117,30 +257,142 @@ class MemoryRequirement:
         cls.pe_count = pe_count
         cls.mss_per_pe = mss_per_pe
         cls.slices_per_mss = slices_per_mss
-    
-    def get_dimension_sizes(self) -> List[int]:
-        return [MemoryRequirement.pe_count, MemoryRequirement.mss_per_pe, MemoryRequirement.slices_per_mss]
-    
+
+        # Build the bit planes once: the base plane for a dimension holds
+        # value 0 everywhere, and shifting by the packed-coordinate stride
+        # moves it to value v. get_affected_mask then reduces to a handful
+        # of integer ORs and two ANDs per requirement.
+        slice_bits = (1 << slices_per_mss) - 1
+        pe_plane = 0
+        for mss in range(mss_per_pe):
+            pe_plane |= slice_bits << (mss << 4)
+        mss_plane = 0
+        for pe in range(pe_count):
+            mss_plane |= slice_bits << (pe << 8)
+        slice_plane = 0
+        for pe in range(pe_count):
+            for mss in range(mss_per_pe):
+                slice_plane |= 1 << ((pe << 8) | (mss << 4))
+
+        cls._pe_value_masks = [pe_plane << (v << 8) for v in range(pe_count)]
+        cls._mss_value_masks = [mss_plane << (v << 4) for v in range(mss_per_pe)]
+        cls._slice_value_masks = [slice_plane << v for v in range(slices_per_mss)]
+
+    @classmethod
+    def acquire(cls, size: int, pe_req: DimensionRequirement, mss_req: DimensionRequirement,
+                slice_req: DimensionRequirement,
+                allocation_mode: SliceAllocationMode = SliceAllocationMode.SERIAL,
+                allocation_id: str = "") -> 'MemoryRequirement':
+        """Pooled constructor: reuse a released instance when one is free.
+
+        Callers with bursty build-allocate-drop cycles pair this with
+        release() to skip per-requirement object allocation; the pooled
+        instance is reinitialized exactly as __init__ would."""
+        if not cls._pool:
+            return cls(size=size, pe_req=pe_req, mss_req=mss_req, slice_req=slice_req,
+                       allocation_mode=allocation_mode, allocation_id=allocation_id)
+        req = cls._pool.pop()
+        req.size = size
+        req.pe_req = pe_req
+        req.mss_req = mss_req
+        req.slice_req = slice_req
+        req.allocation_mode = allocation_mode
+        req.allocation_id = allocation_id
+        req.state = RequirementState.PENDING
+        req.allocation_details = None
+        req._affected_cache = None
+        req._mask_cache = None
+        req._priority_cache = None
+        req.__post_init__()
+        return req
+
+    def release(self):
+        """Return this requirement to the reuse pool.
+
+        The caller must hold no further references: the manager keeps
+        every allocated requirement in processed_requirements, so only
+        release requirements that were never handed to it (e.g. ones
+        that failed validation before collect_requirement)."""
+        # Drop object references so the pooled instance doesn't pin them
+        self.pe_req = None
+        self.mss_req = None
+        self.slice_req = None
+        self.dimension_reqs = []
+        self.allocation_details = None
+        self._affected_cache = None
+        self._mask_cache = None
+        self._priority_cache = None
+        MemoryRequirement._pool.append(self)
+    
+    def get_dimension_sizes(self) -> Tuple[int, int, int]:
+        return self._dim_sizes
+
     def needs_any_selection(self) -> bool:
-        return any(req.needs_selection() for req in self.dimension_reqs)
+        return self._needs_selection
     
-    def get_affected_coordinates(self) -> Set[ResourceCoordinate]:
-        """Generate all coordinates affected by this requirement"""
+    def get_affected_coordinates(self) -> Set[int]:
+        """Generate all packed coordinates affected by this requirement.
+
+        Called from forking, mapping lookup and every candidate scored
+        during dimension resolution, so the set is built once and reused
+        until a dimension value changes."""
+        if self._affected_cache is not None:
+            return self._affected_cache
+
         dimension_sizes = self.get_dimension_sizes()
-        
+
         # Get possible values for each dimension
         possible_values = []
         for i, dim_req in enumerate(self.dimension_reqs):
             possible_values.append(dim_req.get_possible_values(dimension_sizes[i]))
-        
-        # Generate all combinations
-        coords = set()
-        for pe in possible_values[0]:
-            for mss in possible_values[1]:
-                for slice_id in possible_values[2]:
-                    coords.add(ResourceCoordinate(pe, mss, slice_id))
-        
-        return coords
+
+        # Generate all combinations as packed int keys
+        self._affected_cache = frozenset(
+            encode_coordinate(pe, mss, slice_id)
+            for pe, mss, slice_id in product(*possible_values))
+        return self._affected_cache
+
+    def get_affected_mask(self) -> int:
+        """Affected coordinates as a bitmask indexed by packed coordinate.
+
+        Dimensions are independent, so the mask is the AND of one OR-combined
+        bit plane per dimension rather than a loop over the coordinate
+        product."""
+        if self._mask_cache is None:
+            mask = -1
+            for dim_req, value_masks, size in zip(self.dimension_reqs,
+                                                  (MemoryRequirement._pe_value_masks,
+                                                   MemoryRequirement._mss_value_masks,
+                                                   MemoryRequirement._slice_value_masks),
+                                                  self._dim_sizes):
+                dim_mask = 0
+                for value in dim_req.get_possible_values(size):
+                    dim_mask |= value_masks[value]
+                mask &= dim_mask
+            self._mask_cache = mask
+        return self._mask_cache
+
+    def _invalidate_affected_caches(self):
+        """Drop memoized coordinate data after a dimension value change"""
+        self._affected_cache = None
+        self._mask_cache = None
+        self._priority_cache = None
+
+    def get_priority_key(self) -> Tuple[int, int, int, int]:
+        """Ordering key used by _optimize_requirement_order, memoized.
+
+        Lower values = higher priority; see that method for the key
+        semantics. Cached because re-sorts across repeated batch flushes
+        would otherwise re-walk the dimension requirements each time."""
+        if self._priority_cache is None:
+            # Scope breadth score (lower = broader scope); table lookup
+            # instead of an if/elif chain per dimension
+            scope_score = sum(_SCOPE_SCORE_BASE[dim_req.scope] + dim_req.needs_selection()
+                              for dim_req in self.dimension_reqs)
+            auto_count = sum(1 for dim_req in self.dimension_reqs if dim_req.needs_selection())
+            mode = 1 if self.allocation_mode == SliceAllocationMode.PARALLEL else 0
+            self._priority_cache = (scope_score, auto_count, -self.size, mode)
+        return self._priority_cache
     
     def total_allocation_size(self) -> int:
         """
@@ -148,22 +400,7 @@ class MemoryRequirement:
         Returns size * number_of_affected_coordinates based on the requirement scopes.
         For parallel allocation mode, the effective size per coordinate is size // 4.
         """
-        dimension_sizes = self.get_dimension_sizes()
-        
-        # Total coordinates = product of affected counts across all dimensions
-        total_coordinates = 1
-
-        # Calculate affected count for each dimension based on scope
-        affected_counts = []
-        for i, dim_req in enumerate(self.dimension_reqs):
-            if dim_req.scope == DimensionScope.ALL:
-                total_coordinates *= dimension_sizes[i]
-            elif dim_req.scope == DimensionScope.GROUP:
-                assert self.allocation_mode == SliceAllocationMode.PARALLEL
-            else: # SPECIFIC (no need to multiply)
-                pass
-           
-        return self.size * total_coordinates
+        return self._total_size
     
     def mark_fulfilled(self, allocated_address: int, resolved_req: 'MemoryRequirement', mapping_count: int):
         """Mark this requirement as fulfilled with allocation details"""
@@ -207,113 +444,142 @@ class SliceMemoryMap:
     def __init__(self, slice_size: int = 1024*1024):  # 1MB default
         self.slice_size = slice_size
         self.allocations = []  # List of (start, size, allocation_id)
-        self.next_address = 0
-    
+        # Free ranges kept sorted by start so the query methods never
+        # re-derive them from the allocation list, plus a running total so
+        # the accessors hit in the scoring loops are O(1)
+        self.free_ranges: List[Tuple[int, int]] = [(0, slice_size)]
+        self.total_allocated = 0
+        # Max-heap of (-gap_size, start, end) with lazy deletion: carved
+        # ranges go stale in place and are popped when they surface, so
+        # the largest gap never needs a rescan of free_ranges
+        self._gaps_by_size: List[Tuple[int, int, int]] = [(-slice_size, 0, slice_size)]
+        # Copy-on-write flag: cloned maps share these structures until
+        # either side next carves (see clone / _ensure_private)
+        self._shared_state = False
+
+    def _ensure_private(self):
+        """Take private copies of state shared with a clone before writing"""
+        if self._shared_state:
+            self.allocations = self.allocations.copy()
+            self.free_ranges = self.free_ranges.copy()
+            self._gaps_by_size = self._gaps_by_size.copy()
+            self._shared_state = False
+
     def get_total_allocated(self) -> int:
         """Return total allocated bytes in this map"""
-        return sum(size for _, size, _ in self.allocations)
-    
+        return self.total_allocated
+
     def get_total_free(self) -> int:
         """Return total free bytes in this map"""
-        return self.slice_size - self.get_total_allocated()
-    
+        return self.slice_size - self.total_allocated
+
     def get_largest_free_block(self) -> int:
         """Return size of largest contiguous free block"""
-        if not self.allocations:
-            return self.slice_size
-        
-        # Calculate gaps between allocations
-        sorted_allocs = sorted(self.allocations, key=lambda x: x[0])
-        max_gap = 0
-        
-        # Check gap before first allocation
-        if sorted_allocs:
-            max_gap = max(max_gap, sorted_allocs[0][0])
-        
-        # Check gaps between allocations
-        for i in range(len(sorted_allocs) - 1):
-            current_end = sorted_allocs[i][0] + sorted_allocs[i][1]
-            next_start = sorted_allocs[i + 1][0]
-            gap = next_start - current_end
-            max_gap = max(max_gap, gap)
-        
-        # Check gap after last allocation
-        if sorted_allocs:
-            last_end = sorted_allocs[-1][0] + sorted_allocs[-1][1]
-            max_gap = max(max_gap, self.slice_size - last_end)
-        
-        return max_gap
-    
+        self._discard_stale_gaps()
+        return -self._gaps_by_size[0][0] if self._gaps_by_size else 0
+
     def can_accommodate(self, size: int) -> bool:
         """Check if this map can accommodate an allocation of given size"""
         return self.get_largest_free_block() >= size
-    
+
     def get_free_ranges(self) -> List[Tuple[int, int]]:
-        """Get list of (start, end) free ranges"""
-        if not self.allocations:
-            return [(0, self.slice_size)]
-        
-        sorted_allocs = sorted(self.allocations, key=lambda x: x[0])
-        free_ranges = []
-        
-        # Range before first allocation
-        if sorted_allocs[0][0] > 0:
-            free_ranges.append((0, sorted_allocs[0][0]))
-        
-        # Ranges between allocations
-        for i in range(len(sorted_allocs) - 1):
-            current_end = sorted_allocs[i][0] + sorted_allocs[i][1]
-            next_start = sorted_allocs[i + 1][0]
-            if next_start > current_end:
-                free_ranges.append((current_end, next_start))
-        
-        # Range after last allocation
-        last_end = sorted_allocs[-1][0] + sorted_allocs[-1][1]
-        if last_end < self.slice_size:
-            free_ranges.append((last_end, self.slice_size))
-        
-        return free_ranges
-    
+        """Get list of (start, end) free ranges, sorted by start"""
+        return self.free_ranges
+
+    def _discard_stale_gaps(self):
+        """Pop heap entries whose range has since been carved.
+
+        Free ranges never come back once carved (there is no free), so an
+        entry is live exactly when its (start, end) is still present in
+        free_ranges, checked by bisection."""
+        heap = self._gaps_by_size
+        free_ranges = self.free_ranges
+        while heap:
+            entry = heap[0]
+            index = bisect.bisect_left(free_ranges, (entry[1], entry[2]))
+            if index < len(free_ranges) and free_ranges[index] == (entry[1], entry[2]):
+                return
+            heapq.heappop(heap)
+
+    def _carve(self, index: int, address: int, size: int, allocation_id: str):
+        """Remove [address, address+size) from free_ranges[index]"""
+        self._ensure_private()
+        start, end = self.free_ranges[index]
+        remainder = []
+        if address > start:
+            remainder.append((start, address))
+        if address + size < end:
+            remainder.append((address + size, end))
+        self.free_ranges[index:index + 1] = remainder
+
+        # The carved range's heap entry goes stale; push the residuals
+        for new_start, new_end in remainder:
+            heapq.heappush(self._gaps_by_size, (new_start - new_end, new_start, new_end))
+
+        self.allocations.append((address, size, allocation_id))
+        self.total_allocated += size
+
     def allocate_serial(self, size: int, allocation_id: str) -> Optional[int]:
         """Normal contiguous allocation"""
-        free_ranges = self.get_free_ranges()
-        for start, end in free_ranges:
+        for index, (start, end) in enumerate(self.free_ranges):
             if end - start >= size:
-                self.allocations.append((start, size, allocation_id))
+                self._carve(index, start, size, allocation_id)
                 return start
         return None
-    
+
     def allocate_at_address(self, address: int, size: int, allocation_id: str) -> bool:
         """Allocate at specific address"""
-        # Check if address range is free
-        free_ranges = self.get_free_ranges()
-        for start, end in free_ranges:
+        # Locate the free range starting at or before the address
+        index = bisect.bisect_right(self.free_ranges, (address, self.slice_size + 1)) - 1
+        if index >= 0:
+            start, end = self.free_ranges[index]
             if start <= address and address + size <= end:
-                self.allocations.append((address, size, allocation_id))
+                self._carve(index, address, size, allocation_id)
                 return True
         return False
-    
+
     def clone(self) -> 'SliceMemoryMap':
-        """Create a deep copy of this memory map"""
+        """Create a logical copy of this memory map.
+
+        The list structures are shared copy-on-write: forking and batch
+        snapshots clone every touched map, but most clones are never
+        written again, so the copies are deferred until a carve actually
+        happens on one side."""
         new_map = SliceMemoryMap(self.slice_size)
-        new_map.allocations = self.allocations.copy()
-        new_map.next_address = self.next_address
+        new_map.allocations = self.allocations
+        new_map.free_ranges = self.free_ranges
+        new_map.total_allocated = self.total_allocated
+        new_map._gaps_by_size = self._gaps_by_size
+        new_map._shared_state = True
+        self._shared_state = True
         return new_map
 
 
 class MappingSignature:
-    """Represents the allocation pattern signature of a mapping"""
-    def __init__(self, covered_coordinates: Set[ResourceCoordinate]):
-        self.covered_coordinates = frozenset(covered_coordinates)
-        
+    """Represents the allocation pattern signature of a mapping.
+    The covered coordinates are held as one bitmask indexed by packed
+    coordinate (see encode_coordinate), so fork-time intersection and
+    difference run as native bignum AND / AND-NOT instead of per-element
+    frozenset hashing."""
+    __slots__ = ('mask', '_hash')
+
+    def __init__(self, mask: int):
+        self.mask = mask
+        self._hash = None
+
     def __hash__(self):
-        return hash(self.covered_coordinates)
-    
+        # Signatures key signature_to_map and _coord_to_sig, so they are
+        # hashed on every lookup; hashing a multi-thousand-bit mask walks
+        # all its digits, so do it once and remember the result
+        if self._hash is None:
+            self._hash = hash(self.mask)
+        return self._hash
+
     def __eq__(self, other):
-        return self.covered_coordinates == other.covered_coordinates
-    
+        return self.mask == other.mask
+
     def __str__(self):
-        return f"Signature({len(self.covered_coordinates)} coords)"
+        return f"Signature({self.mask.bit_count()} coords)"
 
 
 class IntersectionMap:
@@ -327,27 +593,43 @@ class IntersectionMap:
         """Find address ranges free in ALL constituent maps"""
         if not self.constituent_maps:
             return []
-        
-        # Start with free ranges from first map
-        common_free = self.constituent_maps[0].get_free_ranges()
-        
+
+        # Fold starting from the maps with the fewest free ranges so the
+        # working set shrinks as fast as possible
+        maps_sorted = sorted(self.constituent_maps,
+                             key=lambda map_obj: len(map_obj.get_free_ranges()))
+
+        common_free = maps_sorted[0].get_free_ranges()
+
         # Intersect with each subsequent map
-        for map_obj in self.constituent_maps[1:]:
-            map_free = map_obj.get_free_ranges()
-            common_free = self._intersect_ranges(common_free, map_free)
-        
+        for map_obj in maps_sorted[1:]:
+            if not common_free:
+                break  # intersection already empty, no point continuing
+            common_free = self._intersect_ranges(common_free, map_obj.get_free_ranges())
+
         return common_free
     
-    def _intersect_ranges(self, ranges1: List[Tuple[int, int]], 
+    def _intersect_ranges(self, ranges1: List[Tuple[int, int]],
                          ranges2: List[Tuple[int, int]]) -> List[Tuple[int, int]]:
-        """Compute intersection of two lists of ranges"""
+        """Compute intersection of two sorted lists of ranges.
+
+        Linear two-pointer sweep; both inputs are sorted by start
+        (SliceMemoryMap maintains that invariant), so each pair is
+        visited at most once instead of the full cross product."""
         intersection = []
-        for start1, end1 in ranges1:
-            for start2, end2 in ranges2:
-                overlap_start = max(start1, start2)
-                overlap_end = min(end1, end2)
-                if overlap_start < overlap_end:
-                    intersection.append((overlap_start, overlap_end))
+        i = j = 0
+        while i < len(ranges1) and j < len(ranges2):
+            start1, end1 = ranges1[i]
+            start2, end2 = ranges2[j]
+            overlap_start = max(start1, start2)
+            overlap_end = min(end1, end2)
+            if overlap_start < overlap_end:
+                intersection.append((overlap_start, overlap_end))
+            # Advance whichever range ends first
+            if end1 <= end2:
+                i += 1
+            else:
+                j += 1
         return intersection
     
     def allocate(self, size: int) -> Optional[int]:
@@ -396,60 +678,94 @@ class UnifiedDimensionResolver:
         # Generate all possible combinations for unresolved dimensions
         best_combination = self._find_best_dimension_combination(req, unresolved_dimensions)
         
-        # Apply the best combination
-        resolved_req = copy.deepcopy(req)
-        for dim_index, value in zip(unresolved_dimensions, best_combination):
-            resolved_req.dimension_reqs[dim_index].value = value
-        
+        # Build the resolved requirement with shallow replaces: only the
+        # unresolved DimensionRequirements get fresh copies carrying their
+        # chosen value, the already-fixed ones are shared (they are never
+        # mutated again)
+        resolved_values = dict(zip(unresolved_dimensions, best_combination))
+        new_dim_reqs = [replace(dim_req, value=resolved_values[i]) if i in resolved_values else dim_req
+                        for i, dim_req in enumerate(req.dimension_reqs)]
+        resolved_req = replace(req, pe_req=new_dim_reqs[0],
+                               mss_req=new_dim_reqs[1],
+                               slice_req=new_dim_reqs[2])
+        resolved_req._needs_selection = False  # every dimension now has a value
+
         return resolved_req
     
     def _find_best_dimension_combination(self, req: MemoryRequirement, 
                                        unresolved_dimensions: List[int]) -> Tuple[int, ...]:
         """Find the best combination of values for unresolved dimensions"""
         dimension_sizes = req.get_dimension_sizes()
-        
-        # Generate all possible combinations for unresolved dimensions
-        possible_combinations = []
-        self._generate_combinations(unresolved_dimensions, dimension_sizes, [], possible_combinations)
-        
+
+        # Forward-checking pass: fix one dimension at a time (others stay
+        # unresolved, i.e. cover their full range) and drop any value whose
+        # covering mappings can't accommodate the request. This prunes the
+        # Cartesian product before it is enumerated and also yields the
+        # best score achievable, used to short-circuit the search below.
+        dim_reqs = req.dimension_reqs
+        viable = {}
+        max_free = -1
+        for dim_index in unresolved_dimensions:
+            values = []
+            for value in range(dimension_sizes[dim_index]):
+                dim_reqs[dim_index].value = value
+                req._invalidate_affected_caches()
+                mappings = self.memory_manager.get_affected_mappings(req)
+                dim_reqs[dim_index].value = None
+                req._invalidate_affected_caches()
+
+                feasible = [m.get_total_free() for m in mappings
+                            if m.can_accommodate(req.size)]
+                if feasible:
+                    values.append(value)
+                    max_free = max(max_free, max(feasible))
+            if not values:
+                raise AllocationError("No valid combination found for requirement")
+            viable[dim_index] = values
+
+        # Branch on the most constrained dimension first (fail-first) so
+        # infeasible subtrees are rejected as early as possible
+        ordered = sorted(unresolved_dimensions, key=lambda d: len(viable[d]))
+
         best_combination = None
         best_score = -1
-        
-        for combination in possible_combinations:
-            score = self._evaluate_combination(req, unresolved_dimensions, combination)
+
+        # Enumerate the pruned Cartesian product directly; product is a C
+        # iterator, so nothing is materialized
+        for combination in product(*(viable[d] for d in ordered)):
+            score = self._evaluate_combination(req, ordered, combination)
             if score > best_score:
                 best_score = score
                 best_combination = combination
-        
+                if best_score >= max_free:
+                    break  # nothing can score higher than the largest free mapping
+
         if best_combination is None:
             raise AllocationError("No valid combination found for requirement")
-        
-        return best_combination
-    
-    def _generate_combinations(self, unresolved_dimensions: List[int], dimension_sizes: List[int],
-                             current_combination: List[int], all_combinations: List[Tuple]):
-        """Recursively generate all possible combinations"""
-        if len(current_combination) == len(unresolved_dimensions):
-            all_combinations.append(tuple(current_combination))
-            return
-        
-        dim_index = unresolved_dimensions[len(current_combination)]
-        for value in range(dimension_sizes[dim_index]):
-            current_combination.append(value)
-            self._generate_combinations(unresolved_dimensions, dimension_sizes, 
-                                      current_combination, all_combinations)
-            current_combination.pop()
-    
+
+        # Map back from fail-first order to the caller's dimension order
+        position = {d: i for i, d in enumerate(ordered)}
+        return tuple(best_combination[position[d]] for d in unresolved_dimensions)
+
     def _evaluate_combination(self, req: MemoryRequirement, unresolved_dimensions: List[int], 
                             combination: Tuple[int, ...]) -> float:
         """Evaluate how good this combination is (higher = better)"""
-        # Create test requirement with this combination
-        test_req = copy.deepcopy(req)
+        # Mutate the requirement in place and restore afterwards; the
+        # per-candidate deepcopy this replaces dominated resolution time,
+        # and only the dimension values change
+        dim_reqs = req.dimension_reqs
+        orig_values = [dim_reqs[i].value for i in unresolved_dimensions]
         for dim_index, value in zip(unresolved_dimensions, combination):
-            test_req.dimension_reqs[dim_index].value = value
-        
-        # Check if this combination can be accommodated
-        affected_mappings = self.memory_manager.get_affected_mappings(test_req)
+            dim_reqs[dim_index].value = value
+        req._invalidate_affected_caches()
+
+        try:
+            # Check if this combination can be accommodated
+            affected_mappings = self.memory_manager.get_affected_mappings(req)
+        finally:
+            for dim_index, value in zip(unresolved_dimensions, orig_values):
+                dim_reqs[dim_index].value = value
+            req._invalidate_affected_caches()
         
         if len(affected_mappings) == 0:
             return -1  # Invalid combination
@@ -472,22 +788,51 @@ class UnifiedDimensionResolver:
 
 
 class MappingCentricMemoryManager:
-    def __init__(self, pe_count: int, mss_per_pe: int = 4, slices_per_mss: int = 8):
+    def __init__(self, pe_count: int, mss_per_pe: int = 4, slices_per_mss: int = 8,
+                 verbose: bool = True):
         self.pe_count = pe_count
         self.mss_per_pe = mss_per_pe
         self.slices_per_mss = slices_per_mss
+        # Controls the per-step batch progress output
+        self._verbose = verbose
+
+        # How allocate_all orders its batch (see set_order_strategy)
+        self.order_strategy = OrderStrategy.SCOPE_FIRST
         
         # Set the system dimensions for all MemoryRequirement instances
         MemoryRequirement.set_system_dimensions(pe_count, mss_per_pe, slices_per_mss)
         
         # Only store mappings - derive coordinate info from them
         self.signature_to_map: Dict[MappingSignature, SliceMemoryMap] = {}
+
+        # Inverse index from packed coordinate to its covering signature,
+        # maintained on fork so coordinate lookups are O(1) instead of a
+        # scan over every signature
+        self._coord_to_sig: Dict[int, MappingSignature] = {}
+
+        # Monotonic count of mapping forks; callers snapshot it around an
+        # allocation and compare to detect whether that allocation forked
+        self._fork_epoch = 0
+
+        # Running sum of fulfilled allocation bytes, maintained where
+        # requirements are marked fulfilled (and unwound on backtracking)
+        # so the validation query is O(1)
+        self._total_requested_bytes = 0
         
         # Track all requirements that have been processed
         self.processed_requirements: List[MemoryRequirement] = []
+
+        # Columnar mirror of processed_requirements (allocation sizes and
+        # fulfillment flags) so the summary reductions run as one NumPy
+        # pass instead of per-object method calls. Capacity grows by
+        # doubling; entries past len(processed_requirements) are stale.
+        self._req_sizes = np.zeros(16, dtype=np.int64)
+        self._req_fulfilled = np.zeros(16, dtype=bool)
         
         # Track collected requirements waiting for batch allocation
-        self.collected_requirements: List[MemoryRequirement] = []
+        # deque: appends never trigger the list's doubling reallocation,
+        # and batch commits drain it without taking a full copy first
+        self.collected_requirements: Deque[MemoryRequirement] = deque()
         
         # Initialize with universal mapping covering all coordinates
         self._initialize_universal_mapping()
@@ -497,112 +842,142 @@ class MappingCentricMemoryManager:
     
     def _initialize_universal_mapping(self):
         """Start with one mapping covering all coordinates"""
-        all_coords = {ResourceCoordinate(pe, mss, slice_id) 
-                     for pe in range(self.pe_count)
-                     for mss in range(self.mss_per_pe) 
-                     for slice_id in range(self.slices_per_mss)}
-        
-        universal_signature = MappingSignature(all_coords)
+        all_coords = [encode_coordinate(pe, mss, slice_id)
+                      for pe, mss, slice_id in product(range(self.pe_count),
+                                                       range(self.mss_per_pe),
+                                                       range(self.slices_per_mss))]
+
+        # The all-coordinate mask is the union of the PE bit planes that
+        # set_system_dimensions just built
+        universal_mask = 0
+        for plane in MemoryRequirement._pe_value_masks:
+            universal_mask |= plane
+
+        universal_signature = MappingSignature(universal_mask)
         self.signature_to_map[universal_signature] = SliceMemoryMap()
-    
-    def get_mapping_for_coordinate(self, coord: ResourceCoordinate) -> SliceMemoryMap:
-        """Find which mapping covers this coordinate"""
-        for signature, mapping in self.signature_to_map.items():
-            if coord in signature.covered_coordinates:
-                return mapping
-        raise ValueError(f"No mapping found for coordinate {coord}")
-    
+        self._coord_to_sig = dict.fromkeys(all_coords, universal_signature)
+    
+    def get_mapping_for_coordinate(self, coord: int) -> SliceMemoryMap:
+        """Find which mapping covers this packed coordinate"""
+        signature = self._coord_to_sig.get(coord)
+        if signature is None:
+            raise ValueError(f"No mapping found for coordinate {decode_coordinate(coord)}")
+        return self.signature_to_map[signature]
+
     def get_affected_mappings(self, req: MemoryRequirement) -> Set[SliceMemoryMap]:
         """Get all mappings that would be affected by this requirement"""
         affected_coords = req.get_affected_coordinates()
-        affected_mappings = set()
-        
-        for coord in affected_coords:
-            mapping = self.get_mapping_for_coordinate(coord)
-            affected_mappings.add(mapping)
-        
-        return affected_mappings
-    
-    def _fork_mapping_if_needed(self, req: MemoryRequirement) -> bool:
-        """Fork mappings if the requirement doesn't cover all coordinates in existing mappings"""
-        affected_coords = req.get_affected_coordinates()
-        
+        coord_to_sig = self._coord_to_sig
+        signatures = {coord_to_sig[coord] for coord in affected_coords}
+        return {self.signature_to_map[signature] for signature in signatures}
+
+    def _prepare_allocation(self, req: MemoryRequirement) -> Set[SliceMemoryMap]:
+        """Fork overlapping mappings and return the affected mappings.
+
+        Fused single pass over the mappings the requirement touches: each
+        candidate signature is split against the requirement mask once,
+        forked if it straddles it, and the affected half collected —
+        instead of forking first and then re-walking the affected
+        coordinates to find the mappings."""
+        req_mask = req.get_affected_mask()
+
         # Find all mappings that contain any of the affected coordinates
-        mappings_to_check = set()
-        for coord in affected_coords:
-            for signature, mapping in self.signature_to_map.items():
-                if coord in signature.covered_coordinates:
-                    mappings_to_check.add(signature)
-                    break
-        
-        mappings_forked = False
-        
+        mappings_to_check = {self._coord_to_sig[coord]
+                             for coord in req.get_affected_coordinates()}
+
+        affected_mappings = set()
+
         for signature in mappings_to_check:
-            mapping = self.signature_to_map[signature]
-            
-            # Check if this mapping covers more coordinates than just our affected ones
-            mapping_coords = signature.covered_coordinates
-            affected_coords_in_mapping = mapping_coords.intersection(affected_coords)
-            unaffected_coords_in_mapping = mapping_coords - affected_coords
-            
-            # If this mapping has coordinates not affected by our requirement, we need to fork
-            if len(unaffected_coords_in_mapping) > 0 and len(affected_coords_in_mapping) > 0:
-                # Fork the mapping
-                original_mapping = self.signature_to_map[signature]
-                
-                # Remove the original mapping
-                del self.signature_to_map[signature]
-                
-                # Create new mapping for affected coordinates
-                if len(affected_coords_in_mapping) > 0:
-                    affected_signature = MappingSignature(affected_coords_in_mapping)
-                    self.signature_to_map[affected_signature] = original_mapping.clone()
-                
-                # Create new mapping for unaffected coordinates
-                if len(unaffected_coords_in_mapping) > 0:
-                    unaffected_signature = MappingSignature(unaffected_coords_in_mapping)
-                    self.signature_to_map[unaffected_signature] = original_mapping.clone()
-                
-                mappings_forked = True
-        
-        return mappings_forked
+            # affected_mask is never empty here: the signature was reached
+            # through one of the requirement's coordinates
+            affected_mask = signature.mask & req_mask
+            unaffected_mask = signature.mask & ~req_mask
+
+            if not unaffected_mask:
+                # Fully covered by the requirement, no fork needed
+                affected_mappings.add(self.signature_to_map[signature])
+                continue
+
+            # Fork the mapping
+            original_mapping = self.signature_to_map[signature]
+
+            # Remove the original mapping
+            del self.signature_to_map[signature]
+
+            # Create new mapping for affected coordinates
+            affected_signature = MappingSignature(affected_mask)
+            affected_mapping = original_mapping.clone()
+            self.signature_to_map[affected_signature] = affected_mapping
+            for coord in iter_mask_coordinates(affected_mask):
+                self._coord_to_sig[coord] = affected_signature
+
+            # Create new mapping for unaffected coordinates
+            unaffected_signature = MappingSignature(unaffected_mask)
+            self.signature_to_map[unaffected_signature] = original_mapping.clone()
+            for coord in iter_mask_coordinates(unaffected_mask):
+                self._coord_to_sig[coord] = unaffected_signature
+
+            affected_mappings.add(affected_mapping)
+            self._fork_epoch += 1
+
+        return affected_mappings
     
+    def _append_processed(self, req: MemoryRequirement) -> int:
+        """Record a processed requirement in the list and its columnar mirror"""
+        index = len(self.processed_requirements)
+        self.processed_requirements.append(req)
+        if index == len(self._req_sizes):
+            self._req_sizes = np.concatenate((self._req_sizes,
+                                              np.zeros(index, dtype=np.int64)))
+            self._req_fulfilled = np.concatenate((self._req_fulfilled,
+                                                  np.zeros(index, dtype=bool)))
+        self._req_sizes[index] = req.total_allocation_size()
+        self._req_fulfilled[index] = False
+        return index
+
     def allocate_requirement(self, req: MemoryRequirement) -> bool:
         """Allocate requirement using the mapping-centric approach"""
         # Add to processed requirements list
-        self.processed_requirements.append(req)
-        
+        index = self._append_processed(req)
+
         # Resolve any unresolved dimensions
         resolved_req = self.dimension_resolver.resolve_requirement(req)
-        
-        # Fork mappings if needed (before getting affected mappings)
-        self._fork_mapping_if_needed(resolved_req)
-        
+
+        # Fork mappings if needed and collect the affected set in one pass
+        affected_mappings = self._prepare_allocation(resolved_req)
+
         # Get current mapping count for tracking
         current_mapping_count = len(self.signature_to_map)
-        
-        # Get affected mappings (after potential forking)
-        affected_mappings = self.get_affected_mappings(resolved_req)
-        
-        allocated_address = None
-        
-        if len(affected_mappings) == 1:
-            # Single mapping allocation
-            mapping = next(iter(affected_mappings))
-            if resolved_req.allocation_mode == SliceAllocationMode.PARALLEL:
-                allocated_address = self._allocate_parallel_single_mapping(resolved_req, mapping)
-            else:
-                allocated_address = mapping.allocate_serial(resolved_req.size, resolved_req.allocation_id)
-        else:
-            # Cross-mapping allocation using intersection
-            allocated_address = self._allocate_cross_mapping(resolved_req, affected_mappings)
-        
+
+        allocated_address = self._allocate_in_mappings(resolved_req, affected_mappings)
+
         # If allocation succeeded, mark the original requirement as fulfilled
         if allocated_address is not None:
             req.mark_fulfilled(allocated_address, resolved_req, current_mapping_count)
+            self._req_fulfilled[index] = True
+            self._total_requested_bytes += req.total_allocation_size()
             return True
         else:
             return False
+
+    def _allocate_in_mappings(self, req: MemoryRequirement,
+                              affected_mappings: Set[SliceMemoryMap]) -> Optional[int]:
+        """Dispatch an allocation into already-prepared affected mappings"""
+        if len(affected_mappings) == 1:
+            # Single mapping allocation
+            mapping = next(iter(affected_mappings))
+            if req.allocation_mode == SliceAllocationMode.PARALLEL:
+                return self._allocate_parallel_single_mapping(req, mapping)
+            return mapping.allocate_serial(req.size, req.allocation_id)
+        # Cross-mapping allocation using intersection
+        return self._allocate_cross_mapping(req, affected_mappings)
+
+    @staticmethod
+    def _requirement_fingerprint(req: MemoryRequirement) -> Tuple:
+        """Identity of a requirement's effect on the mapping graph"""
+        return (tuple((dim_req.scope, dim_req.value, dim_req.group)
+                      for dim_req in req.dimension_reqs),
+                req.size, req.allocation_mode)
     
     def _allocate_parallel_single_mapping(self, req: MemoryRequirement, mapping: SliceMemoryMap) -> Optional[int]:
         """Allocate parallel requirement within single mapping"""
@@ -638,7 +1013,7 @@ class MappingCentricMemoryManager:
         
         for signature, mapping in self.signature_to_map.items():
             mapping_stats = {
-                'coordinates_count': len(signature.covered_coordinates),
+                'coordinates_count': signature.mask.bit_count(),
                 'total_free': mapping.get_total_free(),
                 'total_allocated': mapping.get_total_allocated(),
                 'largest_free_block': mapping.get_largest_free_block(),
@@ -650,8 +1025,9 @@ class MappingCentricMemoryManager:
     
     def get_requirements_summary(self) -> Dict[str, Any]:
         """Get summary of all processed requirements and their fulfillment status"""
-        fulfilled_count = sum(1 for req in self.processed_requirements if req.is_fulfilled())
-        pending_count = len(self.processed_requirements) - fulfilled_count
+        count = len(self.processed_requirements)
+        fulfilled_count = int(self._req_fulfilled[:count].sum())
+        pending_count = count - fulfilled_count
         
         return {
             'total_requirements': len(self.processed_requirements),
@@ -672,7 +1048,7 @@ class MappingCentricMemoryManager:
             allocated_in_mapping = memory_map.get_total_allocated()
             
             # Get number of coordinates this mapping covers
-            coordinate_count = len(signature.covered_coordinates)
+            coordinate_count = signature.mask.bit_count()
             
             # Each coordinate in this mapping has the same allocation pattern
             total_bytes += allocated_in_mapping * coordinate_count
@@ -685,13 +1061,9 @@ class MappingCentricMemoryManager:
         This sums the total_allocation_size() for all successfully allocated requirements.
         Should equal total_allocated_bytes() for validation.
         """
-        total_requested = 0
-        
-        for req in self.processed_requirements:
-            if req.is_fulfilled():
-                total_requested += req.total_allocation_size()
-        
-        return total_requested
+        # Maintained incrementally at fulfillment (and unwound on
+        # backtracking), so this is O(1) per call
+        return self._total_requested_bytes
     
     def print_requirements_summary(self):
         """Print a detailed summary of all requirements and their fulfillment status"""
@@ -715,8 +1087,124 @@ class MappingCentricMemoryManager:
 
     def collect_requirement(self, req: MemoryRequirement) -> None:
         """Collect a requirement for later batch allocation"""
+        # Defensive: the caller may have touched dimension values since
+        # the key was last computed
+        req._priority_cache = None
         self.collected_requirements.append(req)
-    
+
+    def set_order_strategy(self, strategy: OrderStrategy) -> None:
+        """Choose how allocate_all orders its collected batch"""
+        self.order_strategy = strategy
+
+    def _snapshot_state(self) -> Tuple[Dict[MappingSignature, SliceMemoryMap], Dict[int, MappingSignature], int]:
+        """Capture the mapping state so commit_batch can backtrack to it"""
+        return ({signature: mapping.clone()
+                 for signature, mapping in self.signature_to_map.items()},
+                self._coord_to_sig.copy(),
+                len(self.processed_requirements))
+
+    def _restore_state(self, snapshot: Tuple[Dict[MappingSignature, SliceMemoryMap], Dict[int, MappingSignature], int]):
+        """Roll the manager back to a snapshot, un-fulfilling undone requirements"""
+        self.signature_to_map, self._coord_to_sig, processed_count = snapshot
+        undone = self.processed_requirements[processed_count:]
+        del self.processed_requirements[processed_count:]
+        for req in undone:
+            if req.is_fulfilled():
+                self._total_requested_bytes -= req.total_allocation_size()
+            req.state = RequirementState.PENDING
+            req.allocation_details = None
+
+    def commit_batch(self) -> Dict[str, Any]:
+        """
+        Allocate all collected requirements largest-first with backtracking.
+
+        Unlike allocate_all, a failed requirement does not simply stay
+        unallocated: the solver backjumps to the most recent earlier
+        allocation whose coordinates overlap the failed requirement
+        (allocations on disjoint coordinates cannot have caused the
+        conflict), undoes everything from that point on and retries with
+        the failed requirement placed ahead of the conflicting one.
+        """
+        if not self.collected_requirements:
+            return {
+                'total_requirements': 0,
+                'successful_allocations': 0,
+                'failed_allocations': 0,
+                'backjumps': 0,
+                'allocation_details': []
+            }
+
+        # Largest footprint first, so the hardest requirements see the
+        # emptiest maps and conflicts surface early
+        ordered = sorted(self.collected_requirements,
+                         key=lambda req: req.total_allocation_size(), reverse=True)
+        self.collected_requirements.clear()
+
+        if self._verbose:
+            print(f"Committing batch of {len(ordered)} requirements (largest first)...")
+            print()
+
+        remaining = deque(ordered)
+        # Trail of (req, state snapshot before its allocation, affected mask)
+        trail: List[Tuple[MemoryRequirement, Any, int]] = []
+        # Promotion budget per requirement bounds the search
+        promotions = dict.fromkeys(map(id, ordered), 0)
+        failed_requirements: List[MemoryRequirement] = []
+        backjumps = 0
+
+        while remaining:
+            req = remaining.popleft()
+            snapshot = self._snapshot_state()
+            if self.allocate_requirement(req):
+                trail.append((req, snapshot, req.get_affected_mask()))
+                continue
+
+            # Conflict set: the deepest prior allocation sharing coordinates
+            failed_mask = req.get_affected_mask()
+            jump = next((depth for depth in range(len(trail) - 1, -1, -1)
+                         if trail[depth][2] & failed_mask), None)
+
+            if jump is None or promotions[id(req)] >= len(ordered):
+                failed_requirements.append(req)
+                if self._verbose:
+                    print(f"  [FAILED] '{req.allocation_id}' ({req.size:,} bytes)")
+                continue
+
+            # Backjump: undo through the conflicting allocation, then retry
+            # with the failed requirement ahead of it
+            promotions[id(req)] += 1
+            backjumps += 1
+            self._restore_state(trail[jump][1])
+            undone = [entry[0] for entry in trail[jump:]]
+            del trail[jump:]
+            if self._verbose:
+                print(f"  Backjump: '{req.allocation_id}' conflicts with "
+                      f"'{undone[0].allocation_id}', replaying {len(undone) + 1} requirements")
+            remaining.extendleft(reversed(undone))
+            remaining.appendleft(req)
+
+        if self._verbose:
+            print()
+            print(f"Batch complete: {len(trail)} allocated, "
+                  f"{len(failed_requirements)} failed, {backjumps} backjump(s)")
+
+        return {
+            'total_requirements': len(ordered),
+            'successful_allocations': len(trail),
+            'failed_allocations': len(failed_requirements),
+            'backjumps': backjumps,
+            'allocation_details': [
+                {
+                    'requirement_id': req.allocation_id,
+                    'size': req.size,
+                    'success': req.state == RequirementState.FULFILLED,
+                    'allocation_details': req.allocation_details
+                }
+                for req in ordered
+            ]
+        }
+
+
     def allocate_all(self) -> Dict[str, Any]:
         """
         Allocate all collected requirements in optimal order to minimize conflicts.
@@ -730,55 +1218,111 @@ class MappingCentricMemoryManager:
                 'allocation_details': []
             }
         
-        # Sort requirements to minimize conflicts and forking
-        ordered_requirements = self._optimize_requirement_order(self.collected_requirements.copy())
+        # Fast path: a batch of purely universal-scope requirements never
+        # forks the mapping graph, so insertion order is as good as any —
+        # skip the ordering pass (and its verbose dump) entirely
+        if all(all(dim_req.scope is DimensionScope.ALL for dim_req in req.dimension_reqs)
+               for req in self.collected_requirements):
+            ordered_requirements = list(self.collected_requirements)
+        else:
+            # Sort requirements to minimize conflicts and forking
+            ordered_requirements = self._optimize_requirement_order(list(self.collected_requirements))
+        # The ordering snapshot is taken; drain the queue up front instead
+        # of holding a second copy through the allocation loop
+        self.collected_requirements.clear()
         
         allocation_results = []
         successful_count = 0
         failed_count = 0
-        
-        print(f"Allocating {len(ordered_requirements)} requirements in optimized order...")
-        print()
-        
-        for i, req in enumerate(ordered_requirements, 1):
-            print(f"Step {i}: Allocating '{req.allocation_id}' ({req.size:,} bytes)")
-            
+
+        # Progress lines are buffered and written once at the end: a
+        # print per step means a stdout lock and flush per step, which
+        # dominates on large batches. verbose=False skips them entirely.
+        out = []
+        if self._verbose:
+            out.append(f"Allocating {len(ordered_requirements)} requirements in optimized order...")
+            out.append("")
+
+        total = len(ordered_requirements)
+        index = 0
+        step = 0
+        while index < total:
+            req = ordered_requirements[index]
+
+            # Identical fully-specified requirements fork the mapping
+            # graph the same way, so a consecutive run of them shares one
+            # fork pass: prepare once, then allocate every member into
+            # the prepared mappings
+            group_end = index + 1
+            if not req.needs_any_selection():
+                fingerprint = self._requirement_fingerprint(req)
+                while (group_end < total
+                       and self._requirement_fingerprint(ordered_requirements[group_end]) == fingerprint):
+                    group_end += 1
+            group = ordered_requirements[index:group_end]
+            index = group_end
+
             # Record state before allocation
             mappings_before = len(self.signature_to_map)
-            
-            # Attempt allocation
-            success = self.allocate_requirement(req)
-            
+            epoch_before = self._fork_epoch
+
+            if len(group) == 1:
+                success_flags = [self.allocate_requirement(req)]
+            else:
+                affected_mappings = self._prepare_allocation(req)
+                mapping_count = len(self.signature_to_map)
+                success_flags = []
+                for member in group:
+                    member_index = self._append_processed(member)
+                    address = self._allocate_in_mappings(member, affected_mappings)
+                    if address is not None:
+                        member.mark_fulfilled(address, member, mapping_count)
+                        self._req_fulfilled[member_index] = True
+                        self._total_requested_bytes += member.total_allocation_size()
+                    success_flags.append(address is not None)
+
             # Record state after allocation
             mappings_after = len(self.signature_to_map)
-            fork_occurred = mappings_after > mappings_before
-            
-            result = {
-                'requirement_id': req.allocation_id,
-                'size': req.size,
-                'success': success,
-                'mappings_before': mappings_before,
-                'mappings_after': mappings_after,
-                'fork_occurred': fork_occurred,
-                'allocation_details': req.allocation_details if success else None
-            }
-            
-            allocation_results.append(result)
-            
-            if success:
-                successful_count += 1
-                fork_msg = f" (forked: {mappings_before} -> {mappings_after})" if fork_occurred else " (no fork)"
-                print(f"  [SUCCESS]{fork_msg}")
-                if req.allocation_details:
-                    print(f"  Address: 0x{req.allocation_details.allocated_address:08x}")
-            else:
-                failed_count += 1
-                print(f"  [FAILED] Could not allocate")
-            print()
-        
-        # Clear collected requirements after processing
-        self.collected_requirements.clear()
-        
+            # The fork epoch detects forking directly instead of inferring
+            # it from the mapping-count delta
+            fork_occurred = self._fork_epoch != epoch_before
+
+            for member, success in zip(group, success_flags):
+                step += 1
+                result = {
+                    'requirement_id': member.allocation_id,
+                    'size': member.size,
+                    'success': success,
+                    'mappings_before': mappings_before,
+                    'mappings_after': mappings_after,
+                    'fork_occurred': fork_occurred,
+                    'allocation_details': member.allocation_details if success else None
+                }
+
+                allocation_results.append(result)
+
+                if success:
+                    successful_count += 1
+                else:
+                    failed_count += 1
+
+                if self._verbose:
+                    # %-formatting beats f-string format specs for the hex
+                    # and thousands-separator fields in CPython
+                    out.append("Step %d: Allocating '%s' (%s bytes)"
+                               % (step, member.allocation_id, format(member.size, ",")))
+                    if success:
+                        fork_msg = f" (forked: {mappings_before} -> {mappings_after})" if fork_occurred else " (no fork)"
+                        out.append(f"  [SUCCESS]{fork_msg}")
+                        if member.allocation_details:
+                            out.append("  Address: 0x%08x" % member.allocation_details.allocated_address)
+                    else:
+                        out.append(f"  [FAILED] Could not allocate")
+                    out.append("")
+
+        if out:
+            sys.stdout.write("\n".join(out) + "\n")
+
         return {
             'total_requirements': len(ordered_requirements),
             'successful_allocations': successful_count,
@@ -789,202 +1333,130 @@ class MappingCentricMemoryManager:
     def _optimize_requirement_order(self, requirements: List[MemoryRequirement]) -> List[MemoryRequirement]:
         """
         Order requirements to minimize conflicts and mapping forking.
-        Strategy: Process broadest scopes first, then progressively narrow down.
+
+        SCOPE_FIRST (default) processes broadest scopes first, then
+        progressively narrows down. Priority keys, primary first, lower
+        values = higher priority:
+        1. Scope breadth (ALL > SPECIFIC > GROUP)
+        2. Number of auto-selections (fewer = higher priority)
+        3. Size (larger = higher priority)
+        4. Allocation mode (SERIAL > PARALLEL for consistency)
+
+        GREEDY_BY_SIZE places the largest requirements first regardless
+        of scope (size, then scope breadth, then auto-selections), which
+        packs better when the batch is dominated by a few big blocks.
+
+        Either way the keys are gathered into columnar arrays and sorted
+        with np.lexsort, so for large batches the comparison loop runs
+        in C instead of through a per-requirement key callback.
         """
-        def requirement_priority(req: MemoryRequirement) -> Tuple[int, int, int, int]:
-            """
-            Return priority tuple for sorting. Lower values = higher priority.
-            Priority order:
-            1. Scope breadth (ALL > SPECIFIC > GROUP)
-            2. Number of auto-selections (fewer = higher priority)
-            3. Size (larger = higher priority) 
-            4. Allocation mode (SERIAL > PARALLEL for consistency)
-            """
-            # Calculate scope breadth score (lower = broader scope)
-            scope_score = 0
-            for dim_req in req.dimension_reqs:
-                if dim_req.scope == DimensionScope.ALL:
-                    scope_score += 0  # Broadest scope
-                elif dim_req.scope == DimensionScope.SPECIFIC:
-                    scope_score += 1 if dim_req.value is not None else 2  # Specific > Auto-select
-                elif dim_req.scope == DimensionScope.GROUP:
-                    scope_score += 1  # Between ALL and SPECIFIC
-            
-            # Count auto-selections (more auto-selections = lower priority)
-            auto_selection_count = sum(1 for dim_req in req.dimension_reqs if dim_req.needs_selection())
-            
-            # Size priority (larger = higher priority, so negate)
-            size_priority = -req.size
-            
-            # Allocation mode priority (SERIAL = 0, PARALLEL = 1)
-            mode_priority = 1 if req.allocation_mode == SliceAllocationMode.PARALLEL else 0
-            
-            return (scope_score, auto_selection_count, size_priority, mode_priority)
-        
-        # Sort by priority
-        sorted_requirements = sorted(requirements, key=requirement_priority)
-        
-        print("Requirement ordering strategy:")
-        print("  1. Process broadest scopes first (ALL > SPECIFIC > GROUP)")
-        print("  2. Minimize auto-selections early")
-        print("  3. Prioritize larger allocations")
-        print("  4. Process serial allocations before parallel")
-        print()
-        
-        for i, req in enumerate(sorted_requirements, 1):
-            scope_desc = self._describe_requirement_scope(req)
-            print(f"  {i}. {req.allocation_id}: {scope_desc} ({req.size:,} bytes)")
-        print()
-        
+        count = len(requirements)
+        scope_scores = np.empty(count, dtype=np.int16)
+        auto_counts = np.empty(count, dtype=np.int16)
+        neg_sizes = np.empty(count, dtype=np.int64)
+        modes = np.empty(count, dtype=np.int8)
+
+        for i, req in enumerate(requirements):
+            scope_scores[i], auto_counts[i], neg_sizes[i], modes[i] = req.get_priority_key()
+
+        # lexsort is stable and takes its primary key last, matching the
+        # equivalent tuple-key sorted() ordering exactly
+        if self.order_strategy is OrderStrategy.GREEDY_BY_SIZE:
+            keys = (modes, auto_counts, scope_scores, neg_sizes)
+        else:
+            keys = (modes, neg_sizes, auto_counts, scope_scores)
+        sorted_requirements = [requirements[i] for i in np.lexsort(keys)]
+
+        if self._verbose:
+            out = ["Requirement ordering strategy:",
+                   "  1. Process broadest scopes first (ALL > SPECIFIC > GROUP)",
+                   "  2. Minimize auto-selections early",
+                   "  3. Prioritize larger allocations",
+                   "  4. Process serial allocations before parallel",
+                   ""]
+            for i, req in enumerate(sorted_requirements, 1):
+                scope_desc = self._describe_requirement_scope(req)
+                out.append("  %d. %s: %s (%s bytes)"
+                           % (i, req.allocation_id, scope_desc, format(req.size, ",")))
+            out.append("")
+            sys.stdout.write("\n".join(out) + "\n")
+
         return sorted_requirements
     
     def _describe_requirement_scope(self, req: MemoryRequirement) -> str:
-        """Generate human-readable description of requirement scope"""
-        pe_desc = self._describe_dimension_scope(req.dimension_reqs[0], "PE")
-        mss_desc = self._describe_dimension_scope(req.dimension_reqs[1], "MSS") 
-        slice_desc = self._describe_dimension_scope(req.dimension_reqs[2], "Slice")
-        
-        mode_desc = " PARALLEL" if req.allocation_mode == SliceAllocationMode.PARALLEL else ""
-        
-        return f"{pe_desc} × {mss_desc} × {slice_desc}{mode_desc}"
-    
-    def _describe_dimension_scope(self, dim_req: DimensionRequirement, dim_name: str) -> str:
-        """Describe a single dimension requirement"""
-        if dim_req.scope == DimensionScope.ALL:
-            return f"All-{dim_name}"
-        elif dim_req.scope == DimensionScope.SPECIFIC:
-            if dim_req.value is not None:
-                return f"{dim_name}{dim_req.value}"
-            else:
-                return f"Auto-{dim_name}"
-        elif dim_req.scope == DimensionScope.GROUP:
-            group_name = dim_req.group.value.replace("group_", "")
-            return f"{dim_name}-{group_name}"
-        else:
-            return f"Unknown-{dim_name}"
+        """Generate human-readable description of requirement scope.
+
+        The per-dimension pieces are memoized on the DimensionRequirement
+        (describe), so repeated ordering dumps only pay the final join."""
+        return "%s × %s × %s%s" % (
+            req.dimension_reqs[0].describe("PE"),
+            req.dimension_reqs[1].describe("MSS"),
+            req.dimension_reqs[2].describe("Slice"),
+            " PARALLEL" if req.allocation_mode == SliceAllocationMode.PARALLEL else "")
 
 
 # Unit Tests
-def test_basic_serial_allocation():
-    """Test basic serial allocation in shared mapping"""
-    print("Testing basic serial allocation...")
-    
-    # Create memory manager with 2 PEs, 2 MSS, 4 slices
-    manager = MappingCentricMemoryManager(pe_count=2, mss_per_pe=2, slices_per_mss=4)
-    
-    # Create requirement: 1KB in all PEs, all MSS, all slices (should not fork)
-    req = MemoryRequirement(
-        size=1024,
-        pe_req=DimensionRequirement(DimensionScope.ALL),
-        mss_req=DimensionRequirement(DimensionScope.ALL),
-        slice_req=DimensionRequirement(DimensionScope.ALL),
-        allocation_id="test_alloc_uniform"
-    )
-    
-    # Should succeed without forking
-    success = manager.allocate_requirement(req)
-    assert success, "Basic allocation should succeed"
-    
-    # Check stats - should still have one mapping
-    stats = manager.get_memory_stats()
-    assert stats['total_mappings'] == 1, f"Should still have one mapping, got {stats['total_mappings']}"
-    
-    # Validate that total requested matches total allocated
-    assert manager.total_requested_allocations() == manager.total_allocated_bytes(), \
-        f"Validation failed: requested={manager.total_requested_allocations()} != allocated={manager.total_allocated_bytes()}"
-    
-    print("✓ Basic serial allocation test passed")
+def _validate(manager: MappingCentricMemoryManager, context: str = ""):
+    """Assert the requested==allocated invariant, shared by every test"""
+    requested = manager.total_requested_allocations()
+    allocated = manager.total_allocated_bytes()
+    where = f" {context}" if context else ""
+    assert requested == allocated, \
+        f"Validation failed{where}: requested={requested} != allocated={allocated}"
 
 
-def test_pe_specific_forking():
-    """Test PE-specific allocation causes mapping fork"""
-    print("Testing PE-specific allocation forking...")
-    
-    manager = MappingCentricMemoryManager(pe_count=2, mss_per_pe=2, slices_per_mss=4)
-    
-    # Create requirement: 1KB in PE 0 only, all MSS, all slices (should fork)
-    req = MemoryRequirement(
-        size=1024,
-        pe_req=DimensionRequirement(DimensionScope.SPECIFIC, value=0),
-        mss_req=DimensionRequirement(DimensionScope.ALL),
-        slice_req=DimensionRequirement(DimensionScope.ALL),
-        allocation_id="pe0_specific"
-    )
-    
-    # Should succeed and cause forking
-    success = manager.allocate_requirement(req)
-    assert success, "PE-specific allocation should succeed"
-    
-    # Check stats - should now have two mappings (PE 0 coords + PE 1 coords)
-    stats = manager.get_memory_stats()
-    assert stats['total_mappings'] == 2, f"Should have two mappings after fork, got {stats['total_mappings']}"
-    
-    # Validate that total requested matches total allocated
-    assert manager.total_requested_allocations() == manager.total_allocated_bytes(), \
-        f"Validation failed: requested={manager.total_requested_allocations()} != allocated={manager.total_allocated_bytes()}"
-    
-    print("✓ PE-specific allocation forking test passed")
+# Single-requirement forking cases, one table row per former test function:
+# (description, (pe_count, mss_per_pe, slices_per_mss),
+#  (pe_spec, mss_spec, slice_spec) as (scope, value, group) triples,
+#  allocation_mode, allocation_id, expected mapping count)
+_ALL = (DimensionScope.ALL, None, None)
+_FORKING_CASES = [
+    ("basic serial allocation (no fork)", (2, 2, 4),
+     (_ALL, _ALL, _ALL),
+     SliceAllocationMode.SERIAL, "test_alloc_uniform", 1),
+    ("PE-specific allocation forks", (2, 2, 4),
+     ((DimensionScope.SPECIFIC, 0, None), _ALL, _ALL),
+     SliceAllocationMode.SERIAL, "pe0_specific", 2),
+    ("MSS-specific allocation forks", (2, 2, 4),
+     (_ALL, (DimensionScope.SPECIFIC, 1, None), _ALL),
+     SliceAllocationMode.SERIAL, "mss1_specific", 2),
+    ("slice group allocation forks", (1, 1, 8),
+     (_ALL, _ALL, (DimensionScope.GROUP, None, SliceGroup.GROUP_0_3)),
+     SliceAllocationMode.PARALLEL, "slice_group_0_3", 2),
+]
 
 
-def test_mss_specific_forking():
-    """Test MSS-specific allocation causes mapping fork"""
-    print("Testing MSS-specific allocation forking...")
-    
-    manager = MappingCentricMemoryManager(pe_count=2, mss_per_pe=2, slices_per_mss=4)
-    
-    # Create requirement: 1KB in all PEs, MSS 1 only, all slices (should fork)
-    req = MemoryRequirement(
-        size=1024,
-        pe_req=DimensionRequirement(DimensionScope.ALL),
-        mss_req=DimensionRequirement(DimensionScope.SPECIFIC, value=1),
-        slice_req=DimensionRequirement(DimensionScope.ALL),
-        allocation_id="mss1_specific"
-    )
-    
-    # Should succeed and cause forking
-    success = manager.allocate_requirement(req)
-    assert success, "MSS-specific allocation should succeed"
-    
-    # Check stats - should now have two mappings
-    stats = manager.get_memory_stats()
-    assert stats['total_mappings'] == 2, f"Should have two mappings after fork, got {stats['total_mappings']}"
-    
-    # Validate that total requested matches total allocated
-    assert manager.total_requested_allocations() == manager.total_allocated_bytes(), \
-        f"Validation failed: requested={manager.total_requested_allocations()} != allocated={manager.total_allocated_bytes()}"
-    
-    print("✓ MSS-specific allocation forking test passed")
+def test_single_requirement_forking():
+    """Table-driven single-requirement cases: fork count plus validation.
 
+    Replaces one near-identical test function per scope shape; each row
+    builds a fresh manager, allocates one 1KB requirement and checks the
+    resulting mapping count and the requested==allocated invariant."""
+    print("Testing single-requirement forking cases...")
 
-def test_slice_group_forking():
-    """Test slice group allocation causes mapping fork"""
-    print("Testing slice group allocation forking...")
-    
-    manager = MappingCentricMemoryManager(pe_count=1, mss_per_pe=1, slices_per_mss=8)
-    
-    # Create requirement: 1KB in all PEs, all MSS, slice group 0-3 only (should fork)
-    req = MemoryRequirement(
-        size=1024,
-        pe_req=DimensionRequirement(DimensionScope.ALL),
-        mss_req=DimensionRequirement(DimensionScope.ALL),
-        slice_req=DimensionRequirement(DimensionScope.GROUP, group=SliceGroup.GROUP_0_3),
-        allocation_mode=SliceAllocationMode.PARALLEL,
-        allocation_id="slice_group_0_3"
-    )
-    
-    # Should succeed and cause forking
-    success = manager.allocate_requirement(req)
-    assert success, "Slice group allocation should succeed"
-    
-    # Check stats - should now have two mappings (group 0-3 + group 4-7)
-    stats = manager.get_memory_stats()
-    assert stats['total_mappings'] == 2, f"Should have two mappings after fork, got {stats['total_mappings']}"
-    
-    # Validate that total requested matches total allocated
-    assert manager.total_requested_allocations() == manager.total_allocated_bytes(), \
-        f"Validation failed: requested={manager.total_requested_allocations()} != allocated={manager.total_allocated_bytes()}"
-    
-    print("✓ Slice group allocation forking test passed")
+    for description, dims, dim_specs, mode, alloc_id, expected_mappings in _FORKING_CASES:
+        pe_count, mss_per_pe, slices_per_mss = dims
+        manager = MappingCentricMemoryManager(pe_count=pe_count, mss_per_pe=mss_per_pe,
+                                              slices_per_mss=slices_per_mss)
+        pe_spec, mss_spec, slice_spec = dim_specs
+        req = MemoryRequirement(
+            size=1024,
+            pe_req=DimensionRequirement(pe_spec[0], value=pe_spec[1], group=pe_spec[2]),
+            mss_req=DimensionRequirement(mss_spec[0], value=mss_spec[1], group=mss_spec[2]),
+            slice_req=DimensionRequirement(slice_spec[0], value=slice_spec[1], group=slice_spec[2]),
+            allocation_mode=mode,
+            allocation_id=alloc_id
+        )
+
+        assert manager.allocate_requirement(req), f"{description}: allocation should succeed"
+
+        stats = manager.get_memory_stats()
+        assert stats['total_mappings'] == expected_mappings, \
+            f"{description}: expected {expected_mappings} mapping(s), got {stats['total_mappings']}"
+        _validate(manager, description)
+        print(f"  ✓ {description}")
+
+    print("✓ Single-requirement forking tests passed")
 
 
 def test_automatic_resource_selection():
@@ -1010,9 +1482,7 @@ def test_automatic_resource_selection():
     stats = manager.get_memory_stats()
     assert stats['total_mappings'] == 2, f"Should have two mappings after auto-selection fork, got {stats['total_mappings']}"
     
-    # Validate that total requested matches total allocated
-    assert manager.total_requested_allocations() == manager.total_allocated_bytes(), \
-        f"Validation failed: requested={manager.total_requested_allocations()} != allocated={manager.total_allocated_bytes()}"
+    _validate(manager)
     
     print("✓ Automatic resource selection test passed")
 
@@ -1042,9 +1512,7 @@ def test_complex_multiple_requirements():
     stats1 = manager.get_memory_stats()
     assert stats1['total_mappings'] == 1, f"Should still have one mapping after global alloc, got {stats1['total_mappings']}"
     
-    # Validate after first allocation
-    assert manager.total_requested_allocations() == manager.total_allocated_bytes(), \
-        f"Validation failed after req1: requested={manager.total_requested_allocations()} != allocated={manager.total_allocated_bytes()}"
+    _validate(manager, "after req1")
     
     # Requirement 2: PE-specific allocation (should fork)
     req2 = MemoryRequirement(
@@ -1061,9 +1529,7 @@ def test_complex_multiple_requirements():
     stats2 = manager.get_memory_stats()
     assert stats2['total_mappings'] == 2, f"Should have two mappings after PE fork, got {stats2['total_mappings']}"
     
-    # Validate after second allocation
-    assert manager.total_requested_allocations() == manager.total_allocated_bytes(), \
-        f"Validation failed after req2: requested={manager.total_requested_allocations()} != allocated={manager.total_allocated_bytes()}"
+    _validate(manager, "after req2")
     
     # Requirement 3: MSS-specific allocation (should cause additional fork)
     req3 = MemoryRequirement(
@@ -1080,9 +1546,7 @@ def test_complex_multiple_requirements():
     stats3 = manager.get_memory_stats()
     assert stats3['total_mappings'] >= 3, f"Should have at least three mappings after MSS fork, got {stats3['total_mappings']}"
     
-    # Validate after third allocation
-    assert manager.total_requested_allocations() == manager.total_allocated_bytes(), \
-        f"Validation failed after req3: requested={manager.total_requested_allocations()} != allocated={manager.total_allocated_bytes()}"
+    _validate(manager, "after req3")
     
     # Requirement 4: Slice group allocation (should cause more forking)
     req4 = MemoryRequirement(
@@ -1103,9 +1567,7 @@ def test_complex_multiple_requirements():
     # Should have multiple mappings due to various forks
     assert final_stats['total_mappings'] >= 4, f"Should have at least four mappings after all forks, got {final_stats['total_mappings']}"
     
-    # Final validation after all allocations
-    assert manager.total_requested_allocations() == manager.total_allocated_bytes(), \
-        f"Validation failed after all allocations: requested={manager.total_requested_allocations()} != allocated={manager.total_allocated_bytes()}"
+    _validate(manager, "after all allocations")
     
     print("✓ Complex multiple requirements test passed")
 
@@ -1132,9 +1594,7 @@ def test_cross_mapping_allocation():
     stats1 = manager.get_memory_stats()
     assert stats1['total_mappings'] == 2, f"Should have two mappings after fork, got {stats1['total_mappings']}"
     
-    # Validate after first allocation
-    assert manager.total_requested_allocations() == manager.total_allocated_bytes(), \
-        f"Validation failed after fork allocation: requested={manager.total_requested_allocations()} != allocated={manager.total_allocated_bytes()}"
+    _validate(manager, "after fork allocation")
     
     # Now try allocation across all PEs (should span mappings)
     req2 = MemoryRequirement(
@@ -1148,9 +1608,7 @@ def test_cross_mapping_allocation():
     success2 = manager.allocate_requirement(req2)
     assert success2, "Cross-mapping allocation should succeed"
     
-    # Final validation after cross-mapping allocation
-    assert manager.total_requested_allocations() == manager.total_allocated_bytes(), \
-        f"Validation failed after cross-mapping allocation: requested={manager.total_requested_allocations()} != allocated={manager.total_allocated_bytes()}"
+    _validate(manager, "after cross-mapping allocation")
     
     print("✓ Cross-mapping allocation test passed")
 
@@ -1174,26 +1632,64 @@ def test_allocation_failure():
     assert not success, "Allocation should fail when insufficient memory"
     
     # Validate even when allocation fails (should both be 0)
-    assert manager.total_requested_allocations() == manager.total_allocated_bytes(), \
-        f"Validation failed for failed allocation: requested={manager.total_requested_allocations()} != allocated={manager.total_allocated_bytes()}"
+    _validate(manager, "for failed allocation")
     
     print("✓ Allocation failure test passed")
 
 
+def test_commit_batch_backtracking():
+    """Test batch commit with backjumping on conflicts"""
+    print("Testing batch commit with backtracking...")
+
+    # A batch that fits: all three should allocate
+    manager = MappingCentricMemoryManager(pe_count=2, mss_per_pe=2, slices_per_mss=4)
+    for i, size in enumerate([256*1024, 128*1024, 64*1024]):
+        manager.collect_requirement(MemoryRequirement(
+            size=size,
+            pe_req=DimensionRequirement(DimensionScope.ALL),
+            mss_req=DimensionRequirement(DimensionScope.ALL),
+            slice_req=DimensionRequirement(DimensionScope.ALL),
+            allocation_id=f"batch_fit_{i}"
+        ))
+    summary = manager.commit_batch()
+    assert summary['successful_allocations'] == 3, \
+        f"All batch requirements should fit, got {summary['successful_allocations']}"
+    _validate(manager, "after batch commit")
+
+    # An over-committed batch: two 700KB requirements against one 1MB
+    # slice. The second failure triggers a backjump (undo + replay) and
+    # exactly one of the two must end up allocated.
+    manager = MappingCentricMemoryManager(pe_count=1, mss_per_pe=1, slices_per_mss=1)
+    for name in ["batch_conflict_a", "batch_conflict_b"]:
+        manager.collect_requirement(MemoryRequirement(
+            size=700*1024,
+            pe_req=DimensionRequirement(DimensionScope.ALL),
+            mss_req=DimensionRequirement(DimensionScope.ALL),
+            slice_req=DimensionRequirement(DimensionScope.ALL),
+            allocation_id=name
+        ))
+    summary = manager.commit_batch()
+    assert summary['successful_allocations'] == 1, \
+        f"Exactly one conflicting requirement should fit, got {summary['successful_allocations']}"
+    assert summary['failed_allocations'] == 1, "The other requirement should fail"
+    assert summary['backjumps'] >= 1, "Conflict should have triggered a backjump"
+    _validate(manager, "after conflicting batch")
+
+    print("✓ Batch commit backtracking test passed")
+
+
 def run_all_tests():
     """Run all unit tests"""
     print("Running memory manager unit tests...\n")
     
     try:
-        test_basic_serial_allocation()
-        test_pe_specific_forking()
-        test_mss_specific_forking()
-        test_slice_group_forking()
+        test_single_requirement_forking()
         test_automatic_resource_selection()
         test_complex_multiple_requirements()
         test_cross_mapping_allocation()
         test_allocation_failure()
-        
+        test_commit_batch_backtracking()
+
         print("\n✅ All tests passed!")
         
     except Exception as e:
@@ -1,7 +1,7 @@
 from typing import Dict, List, Optional, Tuple, Any
 from hw_resources import ResourceScope, HWResource, MemoryResource, DMAResource, BarrierResource
 from hw_components import KernelSizeComponent
-from kernel_types import ResourceRequirement, MemoryRequirement, DMARequirement, BarrierRequirement
+from kernel_types import ResourceKind, ResourceRequirement, MemoryRequirement, DMARequirement, BarrierRequirement
 
 
 class ResourceAllocator:
@@ -41,12 +41,12 @@ class MemoryAllocator(ResourceAllocator):
                 self.pe_memory[(pe_x, pe_y)] = (0x20000000 + (pe_x * self.y_size + pe_y) * 0x1000000, 0)
 
     def allocate(self, requirement: ResourceRequirement) -> List[HWResource]:
-        if not isinstance(requirement, MemoryRequirement):
+        if requirement.kind is not ResourceKind.MEMORY:
             return []
 
         resources = []
 
-        if requirement.scope == ResourceScope.ONE_MSS:
+        if requirement.scope is ResourceScope.ONE_MSS:
             # Allocate from a specific MSS (pick the first one with enough space)
             for mss_id, (base_addr, offset) in self.mss_memory.items():
                 addr = base_addr + offset
@@ -59,7 +59,7 @@ class MemoryAllocator(ResourceAllocator):
                 ))
                 break
 
-        elif requirement.scope == ResourceScope.ONE_PE:
+        elif requirement.scope is ResourceScope.ONE_PE:
             # Allocate from a specific PE (pick the first one with enough space)
             for pe_coords, (base_addr, offset) in self.pe_memory.items():
                 addr = base_addr + offset
@@ -74,7 +74,7 @@ class MemoryAllocator(ResourceAllocator):
                 ))
                 break
 
-        elif requirement.scope == ResourceScope.PE_GROUP:
+        elif requirement.scope is ResourceScope.PE_GROUP:
             # Allocate from all PEs (distribute evenly)
             size_per_pe = requirement.size // (self.x_size * self.y_size)
             for pe_x in range(self.x_size):
@@ -122,12 +122,12 @@ class DMAAllocator(ResourceAllocator):
                 self.pe_dma_channels[(pe_x, pe_y)] = 0
 
     def allocate(self, requirement: ResourceRequirement) -> List[HWResource]:
-        if not isinstance(requirement, DMARequirement):
+        if requirement.kind is not ResourceKind.DMA:
             return []
 
         resources = []
 
-        if requirement.scope == ResourceScope.ONE_MSS:
+        if requirement.scope is ResourceScope.ONE_MSS:
             # Allocate from a specific MSS (pick the first one with available channels)
             for mss_id, next_channel in self.mss_dma_channels.items():
                 if next_channel < 8:  # Assuming 8 channels per MSS
@@ -141,7 +141,7 @@ class DMAAllocator(ResourceAllocator):
                     ))
                     break
 
-        elif requirement.scope == ResourceScope.ONE_PE:
+        elif requirement.scope is ResourceScope.ONE_PE:
             # Allocate from a specific PE (pick the first one with available channels)
             for pe_coords, next_channel in self.pe_dma_channels.items():
                 if next_channel < 4:  # Assuming 4 channels per PE
@@ -157,7 +157,7 @@ class DMAAllocator(ResourceAllocator):
                     ))
                     break
 
-        elif requirement.scope == ResourceScope.PE_GROUP:
+        elif requirement.scope is ResourceScope.PE_GROUP:
             # Allocate from the first available channel in each PE
             for pe_x in range(self.x_size):
                 for pe_y in range(self.y_size):